@@ -0,0 +1,62 @@
+"""Small in-process TTL cache for Norman API responses.
+
+Used by tools to avoid repeating identical GETs within a short window (e.g. an agent
+re-reading the same registration between form steps). Entries expire after a fixed TTL
+and callers invalidate explicitly after writes.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire ``ttl`` seconds after being stored.
+
+    When ``maxsize`` is reached, expired entries are purged first and then the oldest
+    entry is evicted.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for *key*, or *default* if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store *value* under *key* for *ttl* seconds (defaults to the cache TTL)."""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._evict()
+            self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove *key* and return its value (expired or not), or *default*."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[0]
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every entry whose key satisfies *predicate* (e.g. all keys of a company)."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [key for key, (_, expires_at) in self._data.items() if expires_at <= now]:
+            del self._data[key]
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
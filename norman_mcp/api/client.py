@@ -1,10 +1,15 @@
+import asyncio
 import logging
 import requests
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 from urllib.parse import urljoin
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from ..config.settings import config
+from . import json_codec
 from ..security.utils import validate_input, validate_url
 from mcp.server.auth.middleware.auth_context import get_access_token
 from norman_mcp.context import oauth_provider
@@ -12,6 +17,37 @@ from norman_mcp.context import oauth_provider
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+def _build_session() -> requests.Session:
+    """Create a pooled HTTP session so API calls reuse keep-alive connections.
+
+    Gateway errors are retried with a short, capped backoff, but only for safe read
+    methods: a PUT, PATCH or DELETE may already have been applied when the proxy answered
+    502, and replaying it would report a failure (e.g. 404) for a write that succeeded. A
+    POST such as a tax report submission is never replayed either. Retry-After is ignored
+    so a busy backend cannot park a worker thread for minutes; callers that want to wait
+    (submit_tax_report) do so themselves. The final response is returned rather than
+    raised so _make_request handles it as usual.
+    Responses are decompressed transparently: requests advertises gzip/deflate, plus br when
+    brotli is installed (the speedups extra).
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    # Sleeps are 0.2s, 0.4s, 0.8s; cap them explicitly in case the policy is widened
+    retries.backoff_max = 2.0
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 @dataclass
 class NormanAPI:
     """API client for Norman Finance."""
@@ -20,6 +56,8 @@ class NormanAPI:
     company_id: Optional[str] = None
     token_source: str = "env"  # can be 'env', 'oauth', or 'direct_login'
     authenticate_on_init: bool = True  # Whether to authenticate on initialization
+    # Shared across all calls so TCP/TLS handshakes and DNS lookups are amortized
+    _session: requests.Session = field(default_factory=_build_session, init=False, repr=False)
     
     def __post_init__(self):
         """Initialize the API client by authenticating with Norman Finance."""
@@ -90,7 +128,7 @@ class NormanAPI:
         }
         
         try:
-            response = requests.post(auth_url, json=payload, timeout=config.NORMAN_API_TIMEOUT)
+            response = self._session.post(auth_url, json=payload, timeout=config.NORMAN_API_TIMEOUT)
             response.raise_for_status()
             
             auth_data = response.json()
@@ -123,7 +161,7 @@ class NormanAPI:
                 "X-Requested-With": "XMLHttpRequest"
             }
             
-            response = requests.get(
+            response = self._session.get(
                 companies_url,
                 headers=headers,
                 timeout=config.NORMAN_API_TIMEOUT
@@ -237,7 +275,7 @@ class NormanAPI:
         
         try:
             if files and json_data:
-                response = requests.request(
+                response = self._session.request(
                     method=method,
                     url=url,
                     headers=headers,
@@ -247,12 +285,17 @@ class NormanAPI:
                     timeout=config.NORMAN_API_TIMEOUT
                 )
             else:
-                response = requests.request(
+                body = None
+                if json_data is not None and not files:
+                    # Encoded here (orjson when available) rather than by requests' stdlib json
+                    body = json_codec.dumps(json_data).encode("utf-8")
+                    headers["Content-Type"] = "application/json"
+                response = self._session.request(
                     method=method,
                     url=url,
                     headers=headers,
                     params=params,
-                    json=json_data,
+                    data=body,
                     files=files,
                     timeout=config.NORMAN_API_TIMEOUT
                 )
@@ -261,7 +304,7 @@ class NormanAPI:
             # Attempt to parse JSON response, but handle non-JSON responses gracefully
             try:
                 if response.content:
-                    return response.json()
+                    return json_codec.loads(response.content)
                 return {}
             except ValueError:
                 # Not JSON, return content as string if it's not binary
@@ -339,6 +382,19 @@ class NormanAPI:
             logger.error(f"Unexpected error making request to {url}: {str(e)}")
             return {"error": f"Unexpected error: {str(e)}"}
 
+    async def _amake_request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                             json_data: Optional[Dict[str, Any]] = None,
+                             files: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Awaitable _make_request for async tools.
+
+        The blocking call runs in a worker thread (with the caller's context, so the OAuth
+        token lookup still works), keeping the event loop free for other sessions while the
+        pooled session handles keep-alive.
+        """
+        return await asyncio.to_thread(
+            self._make_request, method, url, params=params, json_data=json_data, files=files
+        )
+
     def _refresh_oauth_norman_token(self) -> Optional[str]:
         """Refresh the Norman access token for the current MCP request (OAuth).
 
@@ -368,4 +424,8 @@ class NormanAPI:
     def set_company(self, company_id: str) -> None:
         """Manually set a company ID for this API client."""
         logger.info(f"Manually setting company ID to: {company_id}")
-        self.company_id = company_id
\ No newline at end of file
+        self.company_id = company_id
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and release its connections."""
+        self._session.close()
\ No newline at end of file
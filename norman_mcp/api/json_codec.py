@@ -0,0 +1,31 @@
+"""JSON encoding/decoding with optional orjson acceleration.
+
+orjson is used when installed (``pip install norman-mcp-server[speedups]``); otherwise the
+standard library is used with orjson's compact separators and unescaped non-ASCII, so the
+encoded text matches for the plain data sent to the API.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the optional extra
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize *obj* to a JSON string, leaving non-ASCII characters unescaped."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-string dict keys, which the stdlib coerces and orjson rejects
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from *data*; raises ValueError (json.JSONDecodeError) when invalid."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
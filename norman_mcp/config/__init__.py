@@ -6,3 +6,4 @@ NORMAN_EMAIL = config.NORMAN_EMAIL
 NORMAN_PASSWORD = config.NORMAN_PASSWORD
 NORMAN_ENVIRONMENT = config.NORMAN_ENVIRONMENT
 NORMAN_API_TIMEOUT = config.NORMAN_API_TIMEOUT
+NORMAN_SUBMIT_MAX_ATTEMPTS = config.NORMAN_SUBMIT_MAX_ATTEMPTS
@@ -14,6 +14,8 @@ class Config:
         NORMAN_PASSWORD: Password for stdio transport authentication
         NORMAN_ENVIRONMENT: 'production' or 'sandbox' (default: production)
         NORMAN_API_TIMEOUT: API request timeout in seconds (default: 200)
+        NORMAN_API_MAX_WORKERS: Threads available for blocking API calls made from async tools (default: 32)
+        NORMAN_SUBMIT_MAX_ATTEMPTS: Attempts for a tax report submission rejected as busy (429/503) (default: 3)
         NORMAN_OAUTH_CLIENT_ID: OAuth client ID for Norman OAuth server (required for HTTP transports)
         NORMAN_OAUTH_CLIENT_SECRET: OAuth client secret (optional, for confidential clients)
         NORMAN_MCP_HOST: Host to bind to (default: 0.0.0.0)
@@ -37,6 +39,14 @@ class Config:
     def NORMAN_API_TIMEOUT(self):
         return int(os.getenv("NORMAN_API_TIMEOUT", "200"))
     
+    @property
+    def NORMAN_API_MAX_WORKERS(self):
+        return int(os.getenv("NORMAN_API_MAX_WORKERS", "32"))
+    
+    @property
+    def NORMAN_SUBMIT_MAX_ATTEMPTS(self):
+        return max(1, int(os.getenv("NORMAN_SUBMIT_MAX_ATTEMPTS", "3")))
+    
     @property
     def NORMAN_OAUTH_CLIENT_ID(self):
         """OAuth client ID - required for HTTP transports."""
@@ -15,14 +15,13 @@ def register_resources(mcp):
         company_url = urljoin(config.api_base_url, f"api/v1/companies/{company_id}/")
         
         try:
-            import requests
             headers = {
                 "Authorization": f"Bearer {api.access_token}",
                 "User-Agent": "NormanMCPServer/0.1.0",
                 "X-Requested-With": "XMLHttpRequest",
             }
             
-            response = requests.get(
+            response = api._session.get(
                 company_url,
                 headers=headers,
                 timeout=config.NORMAN_API_TIMEOUT
@@ -197,13 +196,12 @@ def register_resources(mcp):
         clients_url = urljoin(config.api_base_url, "api/v1/tax-advisor/clients/")
 
         try:
-            import requests as req
             headers = {
                 "Authorization": f"Bearer {api.access_token}",
                 "User-Agent": "NormanMCPServer/0.1.0",
                 "X-Requested-With": "XMLHttpRequest",
             }
-            response = req.get(clients_url, headers=headers, timeout=config.NORMAN_API_TIMEOUT)
+            response = api._session.get(clients_url, headers=headers, timeout=config.NORMAN_API_TIMEOUT)
             response.raise_for_status()
             clients = response.json()
         except Exception as e:
@@ -1,3 +1,7 @@
+import re
+from functools import lru_cache
+from itertools import islice
+
 TAX_OFFICE_OPTIONS = [
     { "value": "5202", "label": "Aachen-Kreis" },
     { "value": "5201", "label": "Aachen-Stadt" },
@@ -521,6 +525,18 @@ TAX_OFFICE_OPTIONS = [
     { "value": "2887", "label": "Überlingen (Bodensee)" },
 ]
 
+# Lookup structures built once at import: a code index and the casefolded labels, aligned
+# with TAX_OFFICE_OPTIONS, so searches never re-normalize the ~500 labels per query.
+_TAX_OFFICES_BY_CODE = {office["value"]: office for office in TAX_OFFICE_OPTIONS}
+_TAX_OFFICE_LABELS_CF = tuple(office["label"].casefold() for office in TAX_OFFICE_OPTIONS)
+
+
+@lru_cache(maxsize=128)
+def _search_pattern(term):
+    """Compile (once per term) the matcher for a casefolded search term."""
+    return re.compile(re.escape(term.casefold()))
+
+
 def get_all_tax_offices():
     """
     Returns a list of all tax offices.
@@ -540,8 +556,26 @@ def get_tax_office_by_code(code):
     Returns:
         Dictionary with tax office information or None if not found
     """
-    all_offices = TAX_OFFICE_OPTIONS
-    for office in all_offices:
-        if office["value"] == code:
-            return office
-    return None
+    return _TAX_OFFICES_BY_CODE.get(code)
+
+def search_tax_offices(term, limit=20):
+    """
+    Search tax offices by (part of) their name, case-insensitively.
+
+    Args:
+        term: Search term, e.g. "charlottenburg" or "München"
+        limit: Maximum number of offices to return
+
+    Returns:
+        List of matching tax office dictionaries (at most ``limit``)
+    """
+    term = (term or "").strip()
+    if not term:
+        return []
+    pattern = _search_pattern(term)
+    matches = (
+        office
+        for office, label in zip(TAX_OFFICE_OPTIONS, _TAX_OFFICE_LABELS_CF)
+        if pattern.search(label)
+    )
+    return list(islice(matches, limit))
@@ -9,7 +9,10 @@ This server uses Norman's OAuth for authentication:
 """
 
 import os
+import asyncio
 import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from pydantic import AnyHttpUrl
@@ -224,11 +227,35 @@ async def authenticate_with_credentials(api_client):
         return False
 
 
+# Loop whose default executor has been sized for API calls. The HTTP transports enter
+# the lifespan once per session (or per request when stateless), so the executor is
+# installed only the first time a loop is seen; the loop shuts it down when it closes.
+_executor_loop_ref = None
+
+
+def _install_api_executor(config) -> None:
+    """Size the running loop's default executor for blocking API calls, once per loop."""
+    global _executor_loop_ref
+    loop = asyncio.get_running_loop()
+    if _executor_loop_ref is not None and _executor_loop_ref() is loop:
+        return
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=config.NORMAN_API_MAX_WORKERS, thread_name_prefix="norman-api")
+    )
+    _executor_loop_ref = weakref.ref(loop)
+
+
 @asynccontextmanager
 async def lifespan(app):
     """Server startup/shutdown lifecycle."""
+    from norman_mcp.config.settings import config
+
     logger.info("Starting Norman MCP server")
     
+    # Tools hand their blocking API calls to the default executor via asyncio.to_thread;
+    # size it for concurrent sessions instead of the small cpu-count based default.
+    _install_api_executor(config)
+    
     api_client = NormanAPI(authenticate_on_init=False)
     
     transport = getattr(app, "_transport", "sse")
@@ -242,9 +269,11 @@ async def lifespan(app):
         set_api_client(api_client)
         logger.info(f"Using {transport} transport with OAuth")
     
-    yield {"api": api_client}
-    
-    logger.info("Shutting down Norman MCP server")
+    try:
+        yield {"api": api_client}
+    finally:
+        logger.info("Shutting down Norman MCP server")
+        api_client.close()
 
 
 def create_app(host=None, port=None, public_url=None, transport="sse", streamable_http_options=None):
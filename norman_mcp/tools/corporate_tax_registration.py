@@ -1,11 +1,16 @@
 import logging
+import re
+from datetime import date
 from typing import Any
 from urllib.parse import urljoin
 
 from norman_mcp.context import Context
 from pydantic import Field
+from pydantic.alias_generators import to_camel
 
 from norman_mcp import config
+from norman_mcp.api.cache import TTLCache
+from norman_mcp.resources.tax_offices import search_tax_offices
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +35,41 @@ PERSON_SHAPE = (
 )
 
 
+# Resolved once: the API base URL is fixed at import, so per-call URLs are plain concatenation.
+_CORPORATE_BASE_URL = urljoin(config.api_base_url, "api/v1/corporate-tax-registrations/")
+
+
 def _corporate_url(path: str = "") -> str:
-    return urljoin(config.api_base_url, f"api/v1/corporate-tax-registrations/{path}")
+    return f"{_CORPORATE_BASE_URL}{path}"
+
+
+# The agent re-reads the registration between almost every form step; a short TTL absorbs
+# those repeats while any write through these tools invalidates the entry immediately.
+# Submission happens in the app, so an open registration must not be cached for long; once
+# `submitted` it is final and the agent's status polling can be answered for much longer.
+_REGISTRATION_CACHE = TTLCache(ttl=30)
+_SUBMITTED_TTL = 600
+
+
+async def _get_my_registration(api) -> dict[str, Any]:
+    """GET the company's registration, served from the short-lived cache when possible."""
+    key = api.company_id
+    cached = _REGISTRATION_CACHE.get(key) if key else None
+    if cached is not None:
+        return cached
+    record = await api._amake_request("GET", _corporate_url("my/"))
+    if key and isinstance(record, dict) and "error" not in record:
+        submitted = record.get("status") == "submitted"
+        _REGISTRATION_CACHE.set(key, record, ttl=_SUBMITTED_TTL if submitted else None)
+    return record
+
+
+async def _write(api, method: str, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """Send a create/PATCH and drop the cached registration it makes stale."""
+    try:
+        return await api._amake_request(method, _corporate_url(path), json_data=payload)
+    finally:
+        _REGISTRATION_CACHE.pop(api.company_id, None)
 
 
 def _app_url(path: str = "") -> str:
@@ -43,8 +81,123 @@ def _app_url(path: str = "") -> str:
     return urljoin(base, path)
 
 
+# Optional free-text fields where an empty string deliberately clears the stored value. For
+# every other field "" carries no information (the LLM sends it for "unknown"), so it is
+# dropped like None instead of bloating the PATCH body or blanking a prefilled answer.
+_ALWAYS_KEEP = frozenset(
+    {
+        "businessAdditional",
+        "managementAdditional",
+        "website",
+        "bankAccountHolderName",
+    }
+)
+
+
 def _clean(payload: dict[str, Any]) -> dict[str, Any]:
-    return {key: value for key, value in payload.items() if value is not None}
+    return {
+        key: value
+        for key, value in payload.items()
+        if value is not None and (value != "" or key in _ALWAYS_KEEP)
+    }
+
+
+# Section tool → the Fragebogen fields it accepts. Parameters are the snake_case spelling of
+# the API's camelCase keys; the (apiKey, parameter) pairs are resolved once at import so a
+# call only iterates its own section's fields.
+_SECTION_FIELDS: dict[str, tuple[tuple[str, str], ...]] = {
+    section: tuple((to_camel(name), name) for name in names)
+    for section, names in {
+        "company": (
+            "legal_form", "company_name", "seat_city",
+            "business_street", "business_house_number", "business_additional",
+            "business_postal_code", "business_city", "management_address_same",
+            "management_street", "management_house_number", "management_additional",
+            "management_postal_code", "management_city",
+            "phone", "email", "website", "activity_description", "tax_office",
+        ),
+        "registration": (
+            "notary_contract_date", "hr_application_filed", "hr_application_date",
+            "hr_registered", "hr_registration_date",
+            "register_court", "register_type", "register_number",
+        ),
+        "people": ("representatives", "shareholder_entries"),
+        "financials": (
+            "share_capital", "business_start_date", "divergent_fiscal_year",
+            "fiscal_year_start", "expected_profit_founding_year", "expected_profit_following_year",
+        ),
+        "vat_and_bank": (
+            "expected_revenue_founding_year", "expected_revenue_following_year",
+            "is_kleinunternehmer", "kleinunternehmer_charge_vat",
+            "estimated_vat_amount_founding_year", "taxation_method", "request_vat_id",
+            "bank_iban", "bank_account_holder_role", "bank_account_holder_name",
+        ),
+    }.items()
+}
+
+
+_IBAN_SEPARATORS_RE = re.compile(r"[\s-]")
+_IBAN_SHAPE_RE = re.compile(r"[A-Z]{2}\d{2}[A-Z0-9]{11,30}")
+_INVALID_IBAN = {
+    "error": "invalid_iban",
+    "hint": "The IBAN fails the checksum; ask the user to re-check it (e.g. DE89 3704 0044 0532 0130 00).",
+}
+
+
+def _normalize_iban(iban: str) -> str:
+    """Strip spaces/dashes, uppercase and verify the ISO 7064 mod-97 checksum.
+
+    Raises ValueError for a malformed IBAN (including a non-string value) so the tool
+    can answer without a round-trip.
+    """
+    if not isinstance(iban, str):
+        raise ValueError(iban)
+    iban = _IBAN_SEPARATORS_RE.sub("", iban.upper())
+    if not _IBAN_SHAPE_RE.fullmatch(iban):
+        raise ValueError(iban)
+    # Move the country code and check digits to the end, map A..Z to 10..35, check mod 97
+    digits = "".join(str(int(ch, 36)) for ch in iban[4:] + iban[:4])
+    if int(digits) % 97 != 1:
+        raise ValueError(iban)
+    return iban
+
+
+def _payload(section: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Build a section's PATCH body from its tool arguments (ValueError on an invalid IBAN)."""
+    payload = _clean({api_key: arguments.get(name) for api_key, name in _SECTION_FIELDS[section]})
+    if payload.get("bankIban"):
+        payload["bankIban"] = _normalize_iban(payload["bankIban"])
+    return payload
+
+
+def _section_errors(sections: dict[str, dict[str, Any]]) -> list[str]:
+    """Name every unknown section or field so a bulk update is rejected before any request."""
+    errors = []
+    for section, arguments in sections.items():
+        if section not in _SECTION_FIELDS:
+            errors.append(f"unknown section '{section}'")
+            continue
+        known = {name for _, name in _SECTION_FIELDS[section]}
+        errors.extend(f"unknown field '{section}.{name}'" for name in arguments if name not in known)
+    return errors
+
+
+def _kleinunternehmer_eligibility(start: date, revenue: float) -> dict[str, Any]:
+    """Project founding-year revenue to a full year and compare it to the § 19 UStG limit."""
+    limit = 25000 if start.year >= 2025 else 22000
+    months = 12 - start.month + 1
+    full_year = round(revenue / months * 12, 2)
+    eligible = full_year <= limit
+    return {
+        "eligible": eligible,
+        "limit": limit,
+        "working_months": months,
+        "full_year_equivalent": full_year,
+        "explanation": (
+            f"{revenue:,.2f} EUR over {months} month(s) is {full_year:,.2f} EUR for a full year, "
+            f"{'within' if eligible else 'above'} the {limit:,} EUR Kleinunternehmer limit."
+        ),
+    }
 
 
 def register_corporate_tax_registration_tools(mcp):
@@ -61,7 +214,8 @@ def register_corporate_tax_registration_tools(mcp):
     Orchestration: get_corporate_tax_registration → create_corporate_tax_registration
     (link the incorporation if there is one — it prefills most of the form) → fill the
     sections (update_corporate_company / update_corporate_registration_details /
-    set_corporate_people / update_corporate_financials / update_corporate_vat_and_bank) →
+    set_corporate_people / update_corporate_financials / update_corporate_vat_and_bank, or
+    update_corporate_sections to send several at once) →
     get_corporate_submission_link. IMPORTANT: there is deliberately NO submit tool — the
     questionnaire is e-filed to the Finanzamt via ELSTER, and that final, binding step happens
     only in the Norman app where the user reviews the ELSTER preview and presses Submit
@@ -78,13 +232,40 @@ def register_corporate_tax_registration_tools(mcp):
         transmission protocol PDF.
         """
         api = ctx.request_context.lifespan_context.get("api")
-        return api._make_request("GET", _corporate_url("my/"))
+        return await _get_my_registration(api)
 
     @mcp.tool()
     async def get_corporate_tax_registration_choices(ctx: Context) -> dict[str, Any]:
         """Get the valid values for the corporate Fragebogen enum fields (value → label)."""
         return CORPORATE_CHOICES
 
+    @mcp.tool()
+    async def find_tax_office(
+        ctx: Context,  # noqa: ARG001
+        name: str = Field(description="Part of the Finanzamt name, e.g. 'Charlottenburg' or 'München'"),
+    ) -> dict[str, Any]:
+        """Find a Finanzamt's 4-digit BuFa number by name (for update_corporate_company's
+        tax_office). Matching is case-insensitive on any part of the name."""
+        return {"results": search_tax_offices(name)}
+
+    @mcp.tool()
+    async def compute_kleinunternehmer_eligibility(
+        ctx: Context,  # noqa: ARG001
+        business_start_date: str = Field(description="Beginn der Tätigkeit, YYYY-MM-DD"),
+        expected_revenue_founding_year: float = Field(description="Expected revenue this year, EUR"),
+    ) -> dict[str, Any]:
+        """Check whether the § 19 UStG Kleinunternehmer rule is available in the founding year.
+
+        The founding-year revenue is projected to a full year and compared to the limit for
+        that year. Use the result for update_corporate_vat_and_bank's is_kleinunternehmer
+        instead of working it out yourself.
+        """
+        try:
+            start = date.fromisoformat(business_start_date)
+        except ValueError:
+            return {"error": "invalid_date", "hint": "Use YYYY-MM-DD, e.g. 2025-03-01"}
+        return _kleinunternehmer_eligibility(start, expected_revenue_founding_year)
+
     @mcp.tool()
     async def create_corporate_tax_registration(
         ctx: Context,
@@ -105,7 +286,7 @@ def register_corporate_tax_registration_tools(mcp):
         """
         api = ctx.request_context.lifespan_context.get("api")
         payload = _clean({"source": NORMAN_AGENT_SOURCE, "incorporation": incorporation_public_id})
-        return api._make_request("POST", _corporate_url(), json_data=payload)
+        return await _write(api, "POST", "", payload)
 
     @mcp.tool()
     async def update_corporate_company(  # noqa: PLR0913
@@ -132,34 +313,15 @@ def register_corporate_tax_registration_tools(mcp):
         email: str | None = Field(default=None, description="Delivery email for the confirmation PDF (not e-filed)"),
         website: str | None = Field(default=None),
         activity_description: str | None = Field(default=None, description="Gegenstand des Unternehmens"),
-        tax_office: str | None = Field(default=None, description="Responsible Finanzamt as 4-digit BuFa number"),
+        tax_office: str | None = Field(
+            default=None,
+            description="Responsible Finanzamt as 4-digit BuFa number (look it up with find_tax_office)",
+        ),
     ) -> dict[str, Any]:
         """Section 1 (company): name, seat, addresses, contact, activity and tax office."""
+        payload = _payload("company", locals())
         api = ctx.request_context.lifespan_context.get("api")
-        payload = _clean(
-            {
-                "legalForm": legal_form,
-                "companyName": company_name,
-                "seatCity": seat_city,
-                "businessStreet": business_street,
-                "businessHouseNumber": business_house_number,
-                "businessAdditional": business_additional,
-                "businessPostalCode": business_postal_code,
-                "businessCity": business_city,
-                "managementAddressSame": management_address_same,
-                "managementStreet": management_street,
-                "managementHouseNumber": management_house_number,
-                "managementAdditional": management_additional,
-                "managementPostalCode": management_postal_code,
-                "managementCity": management_city,
-                "phone": phone,
-                "email": email,
-                "website": website,
-                "activityDescription": activity_description,
-                "taxOffice": tax_office,
-            },
-        )
-        return api._make_request("PATCH", _corporate_url(f"{public_id}/"), json_data=payload)
+        return await _write(api, "PATCH", f"{public_id}/", payload)
 
     @mcp.tool()
     async def update_corporate_registration_details(  # noqa: PLR0913
@@ -178,20 +340,9 @@ def register_corporate_tax_registration_tools(mcp):
         ),
     ) -> dict[str, Any]:
         """Section 2 (registration): notary date and Handelsregister state."""
+        payload = _payload("registration", locals())
         api = ctx.request_context.lifespan_context.get("api")
-        payload = _clean(
-            {
-                "notaryContractDate": notary_contract_date,
-                "hrApplicationFiled": hr_application_filed,
-                "hrApplicationDate": hr_application_date,
-                "hrRegistered": hr_registered,
-                "hrRegistrationDate": hr_registration_date,
-                "registerCourt": register_court,
-                "registerType": register_type,
-                "registerNumber": register_number,
-            },
-        )
-        return api._make_request("PATCH", _corporate_url(f"{public_id}/"), json_data=payload)
+        return await _write(api, "PATCH", f"{public_id}/", payload)
 
     @mcp.tool()
     async def set_corporate_people(
@@ -216,9 +367,9 @@ def register_corporate_tax_registration_tools(mcp):
         ),
     ) -> dict[str, Any]:
         """Sections 3+4 (people): managing directors and shareholders, replace-all semantics."""
+        payload = _payload("people", locals())
         api = ctx.request_context.lifespan_context.get("api")
-        payload = _clean({"representatives": representatives, "shareholderEntries": shareholder_entries})
-        return api._make_request("PATCH", _corporate_url(f"{public_id}/"), json_data=payload)
+        return await _write(api, "PATCH", f"{public_id}/", payload)
 
     @mcp.tool()
     async def update_corporate_financials(  # noqa: PLR0913
@@ -235,18 +386,9 @@ def register_corporate_tax_registration_tools(mcp):
         expected_profit_following_year: int | None = Field(default=None, description="Expected profit next year, EUR"),
     ) -> dict[str, Any]:
         """Section 5 (financials): capital, start of activity, fiscal year, expected profits."""
+        payload = _payload("financials", locals())
         api = ctx.request_context.lifespan_context.get("api")
-        payload = _clean(
-            {
-                "shareCapital": share_capital,
-                "businessStartDate": business_start_date,
-                "divergentFiscalYear": divergent_fiscal_year,
-                "fiscalYearStart": fiscal_year_start,
-                "expectedProfitFoundingYear": expected_profit_founding_year,
-                "expectedProfitFollowingYear": expected_profit_following_year,
-            },
-        )
-        return api._make_request("PATCH", _corporate_url(f"{public_id}/"), json_data=payload)
+        return await _write(api, "PATCH", f"{public_id}/", payload)
 
     @mcp.tool()
     async def update_corporate_vat_and_bank(  # noqa: PLR0913
@@ -259,7 +401,10 @@ def register_corporate_tax_registration_tools(mcp):
         ),
         is_kleinunternehmer: bool | None = Field(
             default=None,
-            description="Apply the § 19 UStG Kleinunternehmer rule (no VAT charged)?",
+            description=(
+                "Apply the § 19 UStG Kleinunternehmer rule (no VAT charged)? Only when "
+                "compute_kleinunternehmer_eligibility says eligible"
+            ),
         ),
         kleinunternehmer_charge_vat: bool | None = Field(
             default=None,
@@ -271,28 +416,47 @@ def register_corporate_tax_registration_tools(mcp):
         ),
         taxation_method: str | None = Field(default=None, description="'soll' (default) or 'ist'"),
         request_vat_id: bool | None = Field(default=None, description="Request a USt-IdNr (needed for EU B2B)?"),
-        bank_iban: str | None = Field(default=None, description="IBAN for tax refunds"),
+        bank_iban: str | None = Field(default=None, description="IBAN for tax refunds (spaces/dashes are fine)"),
         bank_account_holder_role: int | None = Field(default=None, description="1 = the company, 99 = someone else"),
         bank_account_holder_name: str | None = Field(default=None, description="Only when the holder is someone else"),
     ) -> dict[str, Any]:
         """Section 6 (VAT & bank): revenue forecast, Kleinunternehmer choice, taxation method,
         VAT ID and the refund bank account."""
+        try:
+            payload = _payload("vat_and_bank", locals())
+        except ValueError:
+            return _INVALID_IBAN
+        api = ctx.request_context.lifespan_context.get("api")
+        return await _write(api, "PATCH", f"{public_id}/", payload)
+
+    @mcp.tool()
+    async def update_corporate_sections(
+        ctx: Context,
+        public_id: str = Field(description="Corporate tax registration publicId"),
+        sections: dict[str, dict[str, Any]] = Field(
+            description=(
+                "Section name → arguments, exactly as the per-section tool takes them "
+                "(snake_case), e.g. {'company': {'company_name': ...}, 'financials': "
+                f"{{'share_capital': ...}}}}. Sections: {', '.join(_SECTION_FIELDS)}"
+            ),
+        ),
+    ) -> dict[str, Any]:
+        """Fill several sections in one request instead of one update_* call per section.
+
+        Same fields and semantics as the per-section tools; prefer this when the user has
+        already answered more than one section (e.g. right after create with a prefill).
+        """
+        errors = _section_errors(sections)
+        if errors:
+            return {"error": "invalid_sections", "details": errors}
+        payload: dict[str, Any] = {}
+        try:
+            for section, arguments in sections.items():
+                payload.update(_payload(section, arguments))
+        except ValueError:
+            return _INVALID_IBAN
         api = ctx.request_context.lifespan_context.get("api")
-        payload = _clean(
-            {
-                "expectedRevenueFoundingYear": expected_revenue_founding_year,
-                "expectedRevenueFollowingYear": expected_revenue_following_year,
-                "isKleinunternehmer": is_kleinunternehmer,
-                "kleinunternehmerChargeVat": kleinunternehmer_charge_vat,
-                "estimatedVatAmountFoundingYear": estimated_vat_amount_founding_year,
-                "taxationMethod": taxation_method,
-                "requestVatId": request_vat_id,
-                "bankIban": bank_iban,
-                "bankAccountHolderRole": bank_account_holder_role,
-                "bankAccountHolderName": bank_account_holder_name,
-            },
-        )
-        return api._make_request("PATCH", _corporate_url(f"{public_id}/"), json_data=payload)
+        return await _write(api, "PATCH", f"{public_id}/", payload)
 
     @mcp.tool()
     async def get_corporate_submission_link(ctx: Context) -> dict[str, Any]:
@@ -304,7 +468,7 @@ def register_corporate_tax_registration_tools(mcp):
         `readyToSubmit` is false, finish the `missing` fields first.
         """
         api = ctx.request_context.lifespan_context.get("api")
-        record = api._make_request("GET", _corporate_url("my/"))
+        record = await _get_my_registration(api)
         sections = record.get("sections", {}) if isinstance(record, dict) else {}
         missing = [name for section in sections.values() for name in section.get("missing", [])]
         return {
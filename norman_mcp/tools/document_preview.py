@@ -0,0 +1,35 @@
+"""Shared helper for the generated-document preview tools (Gewerbe, incorporation)."""
+
+import base64
+
+from norman_mcp.api.client import NormanAPI
+
+JPEG_MAGIC = b"\xff\xd8\xff"
+
+
+def fetch_document_preview(
+    api: NormanAPI, documents_url: str, document_type: str | None = None
+) -> bytes | None:
+    """Fetch a documents listing and decode one document's preview image (blocking).
+
+    Uses the first document, or the first one of *document_type* when given. Returns
+    None when there is no preview yet. Raises ValueError with the backend's message when
+    the request failed, or when the preview is not a JPEG, so the tool reports the real
+    cause instead of a broken image.
+    """
+    response = api._make_request("GET", documents_url)
+    if isinstance(response, dict) and "error" in response:
+        raise ValueError(response["error"])
+    documents = response.get("documents", []) if isinstance(response, dict) else []
+    if document_type is None:
+        documents = documents[:1]
+    for document in documents:
+        if document_type is not None and document.get("type") != document_type:
+            continue
+        if not document.get("previewImage"):
+            continue
+        data = base64.b64decode(document["previewImage"])
+        if not data.startswith(JPEG_MAGIC):
+            raise ValueError("the preview is not a JPEG image")
+        return data
+    return None
@@ -14,6 +14,7 @@ from mcp.types import CallToolResult, ImageContent, TextContent, ToolAnnotations
 from norman_mcp.context import Context
 from norman_mcp import config
 from norman_mcp.security.utils import validate_file_path, validate_input
+from norman_mcp.tools.transactions import invalidate_transaction_searches
 
 logger = logging.getLogger(__name__)
 
@@ -54,36 +55,44 @@ def is_url(path: str) -> bool:
     except Exception:
         return False
 
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+def _create_private_file(path: str):
+    """Create *path* for binary writing, owner-only from the start (fails if it exists)."""
+    return os.fdopen(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600), "wb")
+
 def download_file(url: str) -> Optional[str]:
     """Download a file from URL to a temporary location and return its path."""
     try:
-        response = requests.get(url, stream=True, timeout=30)
-        response.raise_for_status()
-        
-        # Extract filename from URL or Content-Disposition header
-        filename = None
-        
-        if "Content-Disposition" in response.headers:
-            # Try to get filename from Content-Disposition header
-            content_disposition = response.headers["Content-Disposition"]
-            match = re.search(r'filename="?([^"]+)"?', content_disposition)
-            if match:
-                filename = match.group(1)
-        
-        # If no filename found in header, extract from URL
-        if not filename:
-            url_path = urlparse(url).path
-            filename = os.path.basename(url_path) or "downloaded_file"
-        
-        # Create a temporary file
-        temp_dir = tempfile.mkdtemp(prefix="norman_")
-        temp_path = os.path.join(temp_dir, filename)
-        
-        # Write the file
-        with open(temp_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                
+        # Closing the streamed response releases its connection even if the write fails
+        with requests.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            
+            # Extract filename from URL or Content-Disposition header
+            filename = None
+            
+            if "Content-Disposition" in response.headers:
+                # Try to get filename from Content-Disposition header
+                content_disposition = response.headers["Content-Disposition"]
+                match = re.search(r'filename="?([^"]+)"?', content_disposition)
+                if match:
+                    filename = match.group(1)
+            
+            # If no filename found in header, extract from URL
+            if not filename:
+                url_path = urlparse(url).path
+                filename = os.path.basename(url_path) or "downloaded_file"
+            
+            # Create a temporary file
+            temp_dir = tempfile.mkdtemp(prefix="norman_")
+            temp_path = os.path.join(temp_dir, filename)
+            
+            # Write the file in 64 KB chunks so memory stays flat regardless of file size
+            with _create_private_file(temp_path) as f:
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                    
         return temp_path
     except Exception as e:
         logger.error(f"Error downloading file from {url}: {str(e)}")
@@ -107,7 +116,7 @@ def save_base64_to_temp(content_b64: str, file_name: str) -> Optional[str]:
             return None
         temp_dir = tempfile.mkdtemp(prefix="norman_")
         temp_path = os.path.join(temp_dir, file_name)
-        with open(temp_path, "wb") as f:
+        with _create_private_file(temp_path) as f:
             f.write(data)
         logger.info(f"Saved base64 file ({len(data)} bytes) to {temp_path}")
         return temp_path
@@ -130,12 +139,14 @@ def validate_file_path(file_path: str) -> bool:
     is_path_traversal = ".." in file_path or "~" in file_path
     return not is_path_traversal
 
+_UNSAFE_CHARS_RE = re.compile(r'[;<>&|]')
+
 def validate_input(input_str: str) -> str:
     """Validate that input string doesn't contain malicious content."""
     if not input_str:
         return ""
     # Remove any potential script or command injection characters
-    return re.sub(r'[;<>&|]', '', input_str)
+    return _UNSAFE_CHARS_RE.sub('', input_str)
 
 def register_document_tools(mcp):
     """Register all document-related tools with the MCP server."""
@@ -281,6 +292,8 @@ def register_document_tools(mcp):
                 data["cashflow_type"] = cashflow_type
                 
             response = api._make_request("POST", upload_url, json_data=data, files=files)
+            # Attachments change transactions' receipt status (and uploads create transactions)
+            invalidate_transaction_searches(company_id)
             
             # Close all opened file handles
             for file_handle in opened_files:
@@ -560,6 +573,8 @@ def register_document_tools(mcp):
                 data["additional_metadata"] = sanitized_metadata
                 
             response = api._make_request("POST", attachments_url, json_data=data, files=files)
+            # Attachments change transactions' receipt status (and uploads create transactions)
+            invalidate_transaction_searches(company_id)
             
             files["file"].close()
             
@@ -626,7 +641,9 @@ def register_document_tools(mcp):
             "transaction": transaction_id
         }
         
-        return api._make_request("POST", link_url, json_data=link_data)
+        result = api._make_request("POST", link_url, json_data=link_data)
+        invalidate_transaction_searches(company_id)
+        return result
 
     @mcp.tool(
         title="Delete Attachment",
@@ -678,6 +695,7 @@ def register_document_tools(mcp):
         # Backend expects ?confirmed=true to override the GoBD retention guard.
         params = {"confirmed": "true"} if confirm else None
         result = api._make_request("DELETE", attachment_url, params=params)
+        invalidate_transaction_searches(company_id)
         # _make_request returns {} on an empty 204 response — treat any falsy result as success.
         if not result:
             return {"message": f"Attachment {attachment_id} deleted successfully."}
@@ -743,18 +761,19 @@ def register_document_tools(mcp):
                 TextContent(type="text", text=json.dumps(meta, ensure_ascii=False))
             ])
 
-        resp = requests.get(presigned_url, timeout=30)
+        resp = api._session.get(presigned_url, timeout=30)
         resp.raise_for_status()
 
         try:
             from PIL import Image
             from io import BytesIO
             img = Image.open(BytesIO(resp.content))
-            max_dim = 1200
-            if max(img.size) > max_dim:
-                img.thumbnail((max_dim, max_dim), Image.LANCZOS)
+            # thumbnail() keeps the aspect ratio and is a no-op for images already small enough
+            img.thumbnail((1200, 1200), Image.LANCZOS)
             buf = BytesIO()
-            img.convert("RGB").save(buf, format="JPEG", quality=75, optimize=True)
+            # No optimize pass: the preview is sent once, so the extra Huffman-table pass
+            # costs more CPU than the few percent of bytes it saves
+            img.convert("RGB").save(buf, format="JPEG", quality=75)
             image_b64 = base64.b64encode(buf.getvalue()).decode()
             mime = "image/jpeg"
         except Exception:
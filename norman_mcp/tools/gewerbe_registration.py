@@ -1,4 +1,4 @@
-import base64
+import asyncio
 import logging
 from typing import Any
 from urllib.parse import urljoin
@@ -8,6 +8,7 @@ from mcp.server.fastmcp.utilities.types import Image
 from pydantic import Field
 
 from norman_mcp import config
+from norman_mcp.tools.document_preview import fetch_document_preview
 
 logger = logging.getLogger(__name__)
 
@@ -38,8 +39,12 @@ GEWERBE_CHOICES: dict[str, dict[str, str]] = {
 }
 
 
+# Resolved once: the API base URL is fixed at import, so per-call URLs are plain concatenation.
+_GEWERBE_BASE_URL = urljoin(config.api_base_url, "api/v1/gewerbe-registrations/")
+
+
 def _gewerbe_url(path: str = "") -> str:
-    return urljoin(config.api_base_url, f"api/v1/gewerbe-registrations/{path}")
+    return f"{_GEWERBE_BASE_URL}{path}"
 
 
 def _clean(payload: dict[str, Any]) -> dict[str, Any]:
@@ -248,12 +253,18 @@ def register_gewerbe_registration_tools(mcp):
     ) -> Any:
         """Return the first page of the generated GewA 1 as an image for the user to review."""
         api = ctx.request_context.lifespan_context.get("api")
-        response = api._make_request("GET", _gewerbe_url(f"{public_id}/documents/"))
-        documents = response.get("documents", []) if isinstance(response, dict) else []
-        preview = documents[0].get("previewImage") if documents else None
+        # The documents response carries base64 page images: fetch, parse and decode it in a
+        # worker thread so other sessions are not stalled behind it.
+        try:
+            preview = await asyncio.to_thread(
+                fetch_document_preview, api, _gewerbe_url(f"{public_id}/documents/")
+            )
+        except ValueError as e:
+            logger.warning("Gewerbe preview for %s failed: %s", public_id, e)
+            return {"error": f"Preview unavailable: {e}"}
         if not preview:
             return {"error": "No preview available. Generate the document first."}
-        return Image(data=base64.b64decode(preview), format="jpeg")
+        return Image(data=preview, format="jpeg")
 
     @mcp.tool()
     async def get_gewerbe_trade_office(
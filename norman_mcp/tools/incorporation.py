@@ -1,4 +1,4 @@
-import base64
+import asyncio
 import logging
 from typing import Any
 from urllib.parse import urljoin
@@ -8,6 +8,7 @@ from mcp.server.fastmcp.utilities.types import Image
 from pydantic import Field
 
 from norman_mcp import config
+from norman_mcp.tools.document_preview import fetch_document_preview
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +23,12 @@ INCORPORATION_CHOICE_TYPES = (
 )
 
 
+# Resolved once: the API base URL is fixed at import, so per-call URLs are plain concatenation.
+_INCORPORATIONS_BASE_URL = urljoin(config.api_base_url, "api/v1/incorporations/")
+
+
 def _incorporations_url(path: str = "") -> str:
-    return urljoin(config.api_base_url, f"api/v1/incorporations/{path}")
+    return f"{_INCORPORATIONS_BASE_URL}{path}"
 
 
 def _clean(payload: dict[str, Any]) -> dict[str, Any]:
@@ -376,10 +381,19 @@ def register_incorporation_tools(mcp):
     ) -> Any:
         """Show the user a first-page image of a generated founding document for review."""
         api = ctx.request_context.lifespan_context.get("api")
-        response = api._make_request("GET", _incorporations_url(f"{public_id}/documents/"))
-        for document in response.get("documents", []) if isinstance(response, dict) else []:
-            if document.get("type") == document_type and document.get("previewImage"):
-                return Image(data=base64.b64decode(document["previewImage"]), format="jpeg")
+        # Parsing and decoding the base64 page images happens in a worker thread, off the loop.
+        try:
+            preview = await asyncio.to_thread(
+                fetch_document_preview,
+                api,
+                _incorporations_url(f"{public_id}/documents/"),
+                document_type,
+            )
+        except ValueError as e:
+            logger.warning("Incorporation preview %s for %s failed: %s", document_type, public_id, e)
+            return {"error": f"Preview unavailable: {e}"}
+        if preview:
+            return Image(data=preview, format="jpeg")
         return {"error": f"No preview available for '{document_type}'. Generate the documents first."}
 
     @mcp.tool()
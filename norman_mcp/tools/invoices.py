@@ -9,6 +9,7 @@ from pydantic import Field
 from mcp.types import CallToolResult, ImageContent, TextContent, ToolAnnotations
 from norman_mcp.context import Context
 from norman_mcp import config
+from norman_mcp.tools.transactions import invalidate_transaction_searches
 
 logger = logging.getLogger(__name__)
 
@@ -540,7 +541,9 @@ def register_invoice_tools(mcp):
             "transaction": transaction_id
         }
         
-        return api._make_request("POST", link_url, json_data=link_data)
+        result = api._make_request("POST", link_url, json_data=link_data)
+        invalidate_transaction_searches(company_id)
+        return result
 
     @mcp.tool(
         title="Get E-Invoice XML",
@@ -576,7 +579,7 @@ def register_invoice_tools(mcp):
         )
 
         try:
-            response = requests.get(
+            response = api._session.get(
                 xml_url,
                 headers={"Authorization": f"Bearer {api.access_token}"},
                 timeout=config.NORMAN_API_TIMEOUT
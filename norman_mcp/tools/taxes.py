@@ -1,63 +1,197 @@
-import json
+import asyncio
+import base64
 import logging
+import re
 import requests
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
-from urllib.parse import urljoin
+from urllib.parse import parse_qs, urljoin, urlsplit
 from pydantic import Field
-from mcp.types import CallToolResult, ImageContent, TextContent, ToolAnnotations
+from mcp.types import CallToolResult, ImageContent, ResourceLink, TextContent, ToolAnnotations
 
 from norman_mcp.context import Context
 from norman_mcp import config
+from norman_mcp.api.cache import TTLCache
+from norman_mcp.api import json_codec
 
 logger = logging.getLogger(__name__)
 
+# Statuses that mean the backend refused the submission before processing it, so sending it
+# again cannot file the report twice. 502/504 and dropped connections are deliberately not
+# retried: the Finanzamt transmission may already have gone out behind them.
+_SUBMIT_RETRY_STATUSES = frozenset({429, 503})
+
+# update_tax_setting's API field ↔ tool argument mapping
+_TAX_SETTING_FIELDS = (
+    ("taxType", "tax_type"),
+    ("vatType", "vat_type"),
+    ("vatPercent", "vat_percent"),
+    ("startTaxReportDate", "start_tax_report_date"),
+    ("reportingFrequency", "reporting_frequency"),
+)
+
+# Report public IDs are short URL-safe tokens; anything else is rejected before a request.
+_REPORT_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+# Shared tool annotations, built once instead of per registered tool
+_READ_ONLY = ToolAnnotations(
+    readOnlyHint=True,
+    destructiveHint=False,
+    idempotentHint=True,
+    openWorldHint=False,
+)
+_IDEMPOTENT_UPDATE = ToolAnnotations(
+    readOnlyHint=False,
+    destructiveHint=False,
+    idempotentHint=True,
+    openWorldHint=False,
+)
+_SUBMIT = ToolAnnotations(
+    readOnlyHint=False,
+    destructiveHint=True,
+    idempotentHint=False,
+    openWorldHint=False,
+)
+
+# Resolved once: the API base URL is fixed at import, so per-call URLs are plain concatenation.
+_TAXES_BASE_URL = urljoin(config.api_base_url, "api/v1/taxes/")
+_COMPANIES_BASE_URL = urljoin(config.api_base_url, "api/v1/companies/")
+
+
+# Presigned report URLs stay valid for minutes, and agents re-open the same report often.
+_PRESIGN_CACHE = TTLCache(ttl=240)
+# Hand out a cached URL only while it has at least this long left to live.
+_PRESIGN_MARGIN = 30
+
+
+def _presign_ttl(url: str, default: float = 240) -> float:
+    """Seconds a presigned S3 URL remains usable (minus a safety margin).
+
+    Derived from its X-Amz-Date/X-Amz-Expires query parameters; *default* when the URL
+    does not carry them.
+    """
+    query = parse_qs(urlsplit(url).query)
+    try:
+        signed_at = datetime.strptime(query["X-Amz-Date"][0], "%Y%m%dT%H%M%SZ")
+        lifetime = int(query["X-Amz-Expires"][0])
+    except (KeyError, ValueError):
+        return default
+    age = (datetime.now(timezone.utc) - signed_at.replace(tzinfo=timezone.utc)).total_seconds()
+    return lifetime - age - _PRESIGN_MARGIN
+
+
+def _fetch_report_download_url(api, report_id: str) -> Optional[str]:
+    """Fetch a presigned download URL for a tax report PDF (blocking), or None."""
+    cached = _PRESIGN_CACHE.get(report_id)
+    if cached:
+        return cached
+    try:
+        dl_endpoint = f"{_TAXES_BASE_URL}reports/{report_id}/download/"
+        dl_resp = api._make_request("GET", dl_endpoint)
+        url = dl_resp.get("url") or None
+        if url:
+            ttl = _presign_ttl(url)
+            if ttl > 0:
+                _PRESIGN_CACHE.set(report_id, url, ttl=ttl)
+        return url
+    except Exception:
+        logger.debug("Could not fetch presigned download URL for report %s", report_id)
+        return None
+
 
 def _enrich_report_download_url(data: dict, api=None, report_id: str | None = None) -> dict:
     """Add a presigned downloadUrl for the submitted tax report PDF."""
     if not isinstance(data, dict):
         return data
     if api and report_id and data.get("reportFile"):
-        try:
-            dl_endpoint = urljoin(
-                config.api_base_url,
-                f"api/v1/taxes/reports/{report_id}/download/",
-            )
-            dl_resp = api._make_request("GET", dl_endpoint)
-            if dl_resp.get("url"):
-                data["downloadUrl"] = dl_resp["url"]
-        except Exception:
-            logger.debug("Could not fetch presigned download URL for report %s", report_id)
+        download_url = _fetch_report_download_url(api, report_id)
+        if download_url:
+            data["downloadUrl"] = download_url
     return data
 
 
+# First MCP protocol revision with resource_link tool content
+_RESOURCE_LINK_PROTOCOL = "2025-06-18"
+
+
+def _supports_resource_links(ctx: Context) -> bool:
+    """Whether the connected client negotiated a protocol that understands resource links."""
+    try:
+        params = ctx.session.client_params
+    except Exception:
+        return False
+    # Protocol versions are ISO dates, so string order is release order
+    return params is not None and str(params.protocolVersion) >= _RESOURCE_LINK_PROTOCOL
+
+
+def _fetch_preview_image(api, url: str) -> Optional[str]:
+    """Download a preview PNG from its URL and return it base64-encoded (blocking), or None."""
+    try:
+        response = api._session.get(url, timeout=config.NORMAN_API_TIMEOUT)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        logger.warning("Could not fetch tax report preview image: %s", e)
+        return None
+    return base64.b64encode(response.content).decode("ascii")
+
+
+# Tax states are reference data and barely change; tax settings only change through
+# update_tax_setting, which invalidates the company's entry.
+_TAX_STATES_CACHE = TTLCache(ttl=600)
+_TAX_SETTINGS_CACHE = TTLCache(ttl=60)
+
+
+def _cached_get(cache: TTLCache, key: Any, api, url: str) -> Any:
+    """GET *url* through *cache* (blocking); error responses are not cached."""
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    result = api._make_request("GET", url)
+    if key is not None and not (isinstance(result, dict) and "error" in result):
+        cache.set(key, result)
+    return result
+
+
+def _get_tax_states(api) -> Any:
+    return _cached_get(_TAX_STATES_CACHE, "states", api, f"{_TAXES_BASE_URL}states/")
+
+
+def _get_tax_settings(api) -> Any:
+    return _cached_get(_TAX_SETTINGS_CACHE, api.company_id, api, f"{_TAXES_BASE_URL}tax-settings/")
+
+
 def register_tax_tools(mcp):
     """Register all tax-related tools with the MCP server."""
     
     @mcp.tool(
         title="List Tax Reports",
-        annotations=ToolAnnotations(
-            readOnlyHint=True,
-            destructiveHint=False,
-            idempotentHint=True,
-            openWorldHint=False,
-        ),
+        annotations=_READ_ONLY,
     )
-    async def list_tax_reports(ctx: Context) -> Dict[str, Any]:
+    async def list_tax_reports(
+        ctx: Context,
+        limit: Optional[int] = Field(
+            default=None,
+            description="Maximum number of reports to return (default: all)",
+        ),
+    ) -> Dict[str, Any]:
         """List all available tax reports."""
         api = ctx.request_context.lifespan_context["api"]
         
-        taxes_url = urljoin(config.api_base_url, "api/v1/taxes/reports/")
+        taxes_url = f"{_TAXES_BASE_URL}reports/"
+        params = {"limit": limit} if limit else None
         
-        return api._make_request("GET", taxes_url)
+        result = await api._amake_request("GET", taxes_url, params=params)
+        # Trim locally as well in case the endpoint returns the full list regardless
+        if limit and isinstance(result, dict) and isinstance(result.get("results"), list):
+            result["results"] = result["results"][:limit]
+        elif limit and isinstance(result, list):
+            result = result[:limit]
+        return result
 
     @mcp.tool(
         title="Get Tax Report",
-        annotations=ToolAnnotations(
-            readOnlyHint=True,
-            destructiveHint=False,
-            idempotentHint=True,
-            openWorldHint=False,
-        ),
+        annotations=_READ_ONLY,
     )
     async def get_tax_report(
         ctx: Context,
@@ -74,22 +208,18 @@ def register_tax_tools(mcp):
         """
         api = ctx.request_context.lifespan_context["api"]
         
-        report_url = urljoin(
-            config.api_base_url,
-            f"api/v1/taxes/reports/{report_id}/"
-        )
+        report_url = f"{_TAXES_BASE_URL}reports/{report_id}/"
         
-        result = api._make_request("GET", report_url)
-        return _enrich_report_download_url(result, api=api, report_id=report_id)
+        result = await api._amake_request("GET", report_url)
+        # Only reports with a file have a download link (drafts answer 404, which the client
+        # logs as an error); a link fetched recently is served from the presign cache.
+        if isinstance(result, dict) and result.get("reportFile"):
+            result = await asyncio.to_thread(_enrich_report_download_url, result, api, report_id)
+        return result
 
     @mcp.tool(
         title="Validate Tax Number",
-        annotations=ToolAnnotations(
-            readOnlyHint=True,
-            destructiveHint=False,
-            idempotentHint=True,
-            openWorldHint=False,
-        ),
+        annotations=_READ_ONLY,
     )
     async def validate_tax_number(
         ctx: Context,
@@ -108,23 +238,18 @@ def register_tax_tools(mcp):
         """
         api = ctx.request_context.lifespan_context["api"]
         
-        validate_url = urljoin(config.api_base_url, "api/v1/taxes/check-tax-number/")
+        validate_url = f"{_TAXES_BASE_URL}check-tax-number/"
         
         validation_data = {
             "tax_number": tax_number,
             "region_code": region_code
         }
         
-        return api._make_request("POST", validate_url, json_data=validation_data)
+        return await api._amake_request("POST", validate_url, json_data=validation_data)
 
     @mcp.tool(
         title="Generate Finanzamt Preview",
-        annotations=ToolAnnotations(
-            readOnlyHint=True,
-            destructiveHint=False,
-            idempotentHint=True,
-            openWorldHint=False,
-        ),
+        annotations=_READ_ONLY,
     )
     async def generate_finanzamt_preview(
         ctx: Context,
@@ -139,21 +264,33 @@ def register_tax_tools(mcp):
         """
         api = ctx.request_context.lifespan_context["api"]
 
-        if not report_id or not isinstance(report_id, str) or not report_id.strip():
+        if not isinstance(report_id, str) or not _REPORT_ID_RE.fullmatch(report_id):
             raise ValueError("Invalid report ID")
 
-        preview_url = urljoin(
-            config.api_base_url,
-            f"api/v1/taxes/reports/{report_id}/generate-preview-url/",
-        )
+        preview_url = f"{_TAXES_BASE_URL}reports/{report_id}/generate-preview-url/"
 
         try:
-            result = api._make_request("POST", preview_url)
+            result = await api._amake_request("POST", preview_url)
             if not result.get("downloadUrl"):
                 raise ValueError("Preview generation failed: no download URL returned")
 
             content: list = []
             preview_b64 = result.get("previewImage")
+            preview_image_url = result.get("previewImageUrl")
+            if not preview_b64 and preview_image_url:
+                # Newer backends link the PNG instead of inlining it in the JSON body. Clients
+                # that understand resource links fetch it themselves; older ones get it inline.
+                if _supports_resource_links(ctx):
+                    content.append(ResourceLink(
+                        type="resource_link",
+                        name=f"tax-report-{report_id}-preview.png",
+                        uri=preview_image_url,
+                        mimeType="image/png",
+                    ))
+                else:
+                    preview_b64 = await asyncio.to_thread(
+                        _fetch_preview_image, api, preview_image_url
+                    )
             if preview_b64:
                 content.append(ImageContent(
                     type="image",
@@ -164,7 +301,7 @@ def register_tax_tools(mcp):
             meta = {k: v for k, v in result.items() if k != "previewImage"}
             content.append(TextContent(
                 type="text",
-                text=json.dumps(meta, ensure_ascii=False),
+                text=json_codec.dumps(meta),
             ))
 
             return CallToolResult(content=content)
@@ -179,12 +316,7 @@ def register_tax_tools(mcp):
 
     @mcp.tool(
         title="Submit Tax Report to Finanzamt",
-        annotations=ToolAnnotations(
-            readOnlyHint=False,
-            destructiveHint=True,
-            idempotentHint=False,
-            openWorldHint=False,
-        ),
+        annotations=_SUBMIT,
     )
     async def submit_tax_report(
         ctx: Context,
@@ -202,14 +334,23 @@ def register_tax_tools(mcp):
         """
         api = ctx.request_context.lifespan_context["api"]
         
-        submit_url = urljoin(
-            config.api_base_url,
-            f"api/v1/taxes/reports/{report_id}/submit-report/"
-        )
+        submit_url = f"{_TAXES_BASE_URL}reports/{report_id}/submit-report/"
         
         try:
-            result = api._make_request("POST", submit_url)
-            return _enrich_report_download_url(result, api=api, report_id=report_id)
+            max_attempts = config.NORMAN_SUBMIT_MAX_ATTEMPTS
+            for attempt in range(1, max_attempts + 1):
+                result = await api._amake_request("POST", submit_url)
+                status = result.get("status_code") if isinstance(result, dict) else None
+                if status not in _SUBMIT_RETRY_STATUSES or attempt == max_attempts:
+                    break
+                logger.warning(
+                    "Submitting tax report %s failed with %s (attempt %d/%d), retrying",
+                    report_id, status, attempt, max_attempts,
+                )
+                await asyncio.sleep(min(2 ** (attempt - 1), 8))
+            return await asyncio.to_thread(
+                _enrich_report_download_url, result, api=api, report_id=report_id
+            )
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
                 return {
@@ -221,12 +362,7 @@ def register_tax_tools(mcp):
 
     @mcp.tool(
         title="List German Tax States",
-        annotations=ToolAnnotations(
-            readOnlyHint=True,
-            destructiveHint=False,
-            idempotentHint=True,
-            openWorldHint=False,
-        ),
+        annotations=_READ_ONLY,
     )
     async def list_tax_states(ctx: Context) -> Dict[str, Any]:
         """
@@ -237,18 +373,11 @@ def register_tax_tools(mcp):
         """
         api = ctx.request_context.lifespan_context["api"]
         
-        states_url = urljoin(config.api_base_url, "api/v1/taxes/states/")
-        
-        return api._make_request("GET", states_url)
+        return await asyncio.to_thread(_get_tax_states, api)
 
     @mcp.tool(
         title="List Tax Settings",
-        annotations=ToolAnnotations(
-            readOnlyHint=True,
-            destructiveHint=False,
-            idempotentHint=True,
-            openWorldHint=False,
-        ),
+        annotations=_READ_ONLY,
     )
     async def list_tax_settings(ctx: Context) -> Dict[str, Any]:
         """
@@ -259,18 +388,11 @@ def register_tax_tools(mcp):
         """
         api = ctx.request_context.lifespan_context["api"]
         
-        settings_url = urljoin(config.api_base_url, "api/v1/taxes/tax-settings/")
-        
-        return api._make_request("GET", settings_url)
+        return await asyncio.to_thread(_get_tax_settings, api)
 
     @mcp.tool(
         title="Update Tax Setting",
-        annotations=ToolAnnotations(
-            readOnlyHint=False,
-            destructiveHint=False,
-            idempotentHint=True,
-            openWorldHint=False,
-        ),
+        annotations=_IDEMPOTENT_UPDATE,
     )
     async def update_tax_setting(
         ctx: Context,
@@ -297,37 +419,28 @@ def register_tax_tools(mcp):
         """
         api = ctx.request_context.lifespan_context["api"]
         
-        setting_url = urljoin(
-            config.api_base_url,
-            f"api/v1/taxes/tax-settings/{setting_id}/"
-        )
+        setting_url = f"{_TAXES_BASE_URL}tax-settings/{setting_id}/"
         
-        update_data = {}
-        if tax_type:
-            update_data["taxType"] = tax_type
-        if vat_type:
-            update_data["vatType"] = vat_type
-        if vat_percent is not None:
-            update_data["vatPercent"] = vat_percent
-        if start_tax_report_date:
-            update_data["startTaxReportDate"] = start_tax_report_date
-        if reporting_frequency:
-            update_data["reportingFrequency"] = reporting_frequency
+        arguments = locals()
+        # Unset and empty values are skipped; 0 is a valid vat_percent and is kept
+        update_data = {
+            api_name: arguments[name]
+            for api_name, name in _TAX_SETTING_FIELDS
+            if arguments[name] not in (None, "")
+        }
             
-        # Only make request if there are changes
+        # Only make request if there are changes. The PATCH is always sent: the cached
+        # listing may predate a change made in the app, so it cannot prove a no-op.
         if update_data:
-            return api._make_request("PATCH", setting_url, json_data=update_data)
+            result = await api._amake_request("PATCH", setting_url, json_data=update_data)
+            _TAX_SETTINGS_CACHE.pop(api.company_id, None)
+            return result
         else:
             return {"message": "No changes to apply"}
 
     @mcp.tool(
         title="Get Company Tax Statistics",
-        annotations=ToolAnnotations(
-            readOnlyHint=True,
-            destructiveHint=False,
-            idempotentHint=True,
-            openWorldHint=False,
-        ),
+        annotations=_READ_ONLY,
     )
     async def get_company_tax_statistics(ctx: Context) -> Dict[str, Any]:
         """
@@ -342,21 +455,13 @@ def register_tax_tools(mcp):
         if not company_id:
             return {"error": "No company available. Please authenticate first."}
         
-        stats_url = urljoin(
-            config.api_base_url,
-            f"api/v1/companies/{company_id}/company-tax-statistic/"
-        )
+        stats_url = f"{_COMPANIES_BASE_URL}{company_id}/company-tax-statistic/"
         
-        return api._make_request("GET", stats_url)
+        return await api._amake_request("GET", stats_url)
 
     @mcp.tool(
         title="Get Next VAT Report",
-        annotations=ToolAnnotations(
-            readOnlyHint=True,
-            destructiveHint=False,
-            idempotentHint=True,
-            openWorldHint=False,
-        ),
+        annotations=_READ_ONLY,
     )
     async def get_vat_next_report(ctx: Context) -> Dict[str, Any]:
         """
@@ -371,9 +476,34 @@ def register_tax_tools(mcp):
         if not company_id:
             return {"error": "No company available. Please authenticate first."}
         
-        vat_url = urljoin(
-            config.api_base_url,
-            f"api/v1/companies/{company_id}/vat-next-report-amount/"
-        )
+        vat_url = f"{_COMPANIES_BASE_URL}{company_id}/vat-next-report-amount/"
         
-        return api._make_request("GET", vat_url) 
\ No newline at end of file
+        return await api._amake_request("GET", vat_url) 
+
+    @mcp.tool(
+        title="Get Tax Dashboard",
+        annotations=_READ_ONLY,
+    )
+    async def get_tax_dashboard(ctx: Context) -> Dict[str, Any]:
+        """
+        Get tax states, the company's tax settings and its tax statistics in one call.
+
+        Prefer this over calling list_tax_states, list_tax_settings and
+        get_company_tax_statistics one after another; the three are fetched concurrently.
+
+        Returns:
+            Dict with "states", "settings" and "stats"
+        """
+        api = ctx.request_context.lifespan_context["api"]
+        company_id = api.company_id
+
+        if not company_id:
+            return {"error": "No company available. Please authenticate first."}
+
+        stats_url = f"{_COMPANIES_BASE_URL}{company_id}/company-tax-statistic/"
+        states, settings, stats = await asyncio.gather(
+            asyncio.to_thread(_get_tax_states, api),
+            asyncio.to_thread(_get_tax_settings, api),
+            api._amake_request("GET", stats_url),
+        )
+        return {"states": states, "settings": settings, "stats": stats}
@@ -1,15 +1,337 @@
+import asyncio
+import bisect
 import logging
-from typing import Dict, Any, Optional, List
+import re
+import time
+from typing import Dict, Any, Literal, Optional, List, get_args
 from urllib.parse import urljoin
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pydantic import Field
 
 from mcp.types import ToolAnnotations
 from norman_mcp.context import Context
 from norman_mcp import config
+from norman_mcp.api.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Resolved once: the API base URL is fixed at import, so per-call URLs are plain concatenation.
+_COMPANIES_BASE_URL = urljoin(config.api_base_url, "api/v1/companies/")
+_DETECT_CATEGORY_URL = urljoin(config.api_base_url, "api/v1/assistant/detect-category/")
+
+
+def _transactions_url(company_id: str, path: str = "") -> str:
+    return f"{_COMPANIES_BASE_URL}{company_id}/accounting/transactions/{path}"
+
+
+# Category suggestions for recurring merchants (subscriptions, the same supermarket) are
+# reused instead of asking the AI endpoint again. The key drops dates from the description,
+# but keeps other digits (store and contract numbers), the amount's sign and GWG bracket
+# (which decides between expensing and capitalising), the type and the company, since
+# categories come from the company's own chart of accounts. Descriptions with nothing but
+# generic payment words ("Rechnung 123", "SEPA Überweisung") say nothing about the merchant
+# and are never cached.
+_CATEGORY_CACHE = TTLCache(ttl=3600, maxsize=4096)
+_DATE_LIKE_RE = re.compile(r"\d{1,4}[./-]\d{1,2}(?:[./-]\d{2,4})?")
+_WHITESPACE_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"[^\W\d_]+")
+_GENERIC_WORDS = frozenset({
+    "rechnung", "invoice", "überweisung", "ueberweisung", "zahlung", "payment",
+    "lastschrift", "gutschrift", "sepa", "transfer", "dauerauftrag", "kartenzahlung",
+})
+_AMOUNT_BRACKETS = (250, 800, 1000)
+
+
+def _merchant_key(description: str) -> str:
+    """Normalize a transaction description to the merchant part used as a cache key.
+
+    Returns "" when no specific merchant is left, so the result is not cached.
+    """
+    key = _WHITESPACE_RE.sub(" ", _DATE_LIKE_RE.sub("", description)).strip().casefold()
+    if not any(len(word) >= 3 and word not in _GENERIC_WORDS for word in _WORD_RE.findall(key)):
+        return ""
+    return key
+
+
+def _amount_bracket(amount: float) -> int:
+    """Index of the GWG bracket (up to 250, 800, 1000 EUR, above) the absolute amount falls in."""
+    return bisect.bisect_left(_AMOUNT_BRACKETS, abs(amount))
+
+
+# Tool argument → API query parameter. Search filters are only sent when truthy, so
+# no_invoice/no_receipt=False (and 0 amounts) mean "don't filter", as before.
+_SEARCH_PARAM_MAP = {
+    "description": "description",
+    "from_date": "dateFrom",
+    "to_date": "dateTo",
+    "min_amount": "minAmount",
+    "max_amount": "maxAmount",
+    "category": "category_name",
+    "no_invoice": "noInvoice",
+    "no_receipt": "noAttachment",
+    "status": "status",
+    "cashflow_type": "cashflowType",
+    "limit": "limit",
+}
+
+# Tool argument → API field for update_transaction (anything not None is sent). category_id
+# comes after category so it wins when both are given; amount is handled separately.
+_UPDATE_PARAM_MAP = {
+    "description": "description",
+    "category": "category",
+    "date": "valueDate",
+    "vat_rate": "vatRate",
+    "sale_type": "saleType",
+    "supplier_country": "supplierCountry",
+    "cashflow_type": "cashflowType",
+    "category_id": "category",
+    "company_category_id": "companyCategory",
+    "payment_date": "paymentDate",
+    "payment_type": "paymentType",
+}
+
+
+# Cheap local checks for enumerated and date arguments, so a malformed value is rejected
+# before it costs a round trip to the API. Dates stay strings; they must have the
+# YYYY-MM-DD shape (fromisoformat alone also takes e.g. 20250101) and be a real date.
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# create_transaction declares the enumerations as Literal types, so the tool schema lists
+# the allowed values and pydantic rejects others; the sets cover the dict-based tools.
+_DATE_ARGUMENTS = ("from_date", "to_date", "date", "payment_date")
+CashflowType = Literal["INCOME", "EXPENSE"]
+SupplierCountry = Literal["DE", "INSIDE_EU", "OUTSIDE_EU"]
+VatRate = Literal[0, 7, 19]
+SaleType = Literal["GOODS", "SERVICES"]
+PaymentType = Literal["BANK", "CASH", "NOT_PAID"]
+_CASHFLOW_TYPES = frozenset(get_args(CashflowType))
+_SUPPLIER_COUNTRIES = frozenset(get_args(SupplierCountry))
+_VAT_RATES = frozenset(get_args(VatRate))
+_SALE_TYPES = frozenset(get_args(SaleType))
+_PAYMENT_TYPES = frozenset(get_args(PaymentType))
+_STATUSES = frozenset({"UNVERIFIED", "VERIFIED"})
+# An empty sale_type is how update_transaction clears the field (and what create sends
+# when none is given), so it is accepted alongside the real values.
+_ALLOWED_VALUES = {
+    "cashflow_type": _CASHFLOW_TYPES,
+    "supplier_country": _SUPPLIER_COUNTRIES,
+    "vat_rate": _VAT_RATES,
+    "sale_type": _SALE_TYPES | {""},
+    "payment_type": _PAYMENT_TYPES,
+    "status": _STATUSES,
+}
+
+
+def _is_iso_date(value: Any) -> bool:
+    """Whether *value* is a YYYY-MM-DD string naming an existing calendar day."""
+    if not (isinstance(value, str) and _DATE_RE.fullmatch(value)):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _validation_error(arguments: Dict[str, Any]) -> Optional[str]:
+    """Return an error message for the first malformed tool argument, or None."""
+    for name in _DATE_ARGUMENTS:
+        value = arguments.get(name)
+        if value and not _is_iso_date(value):
+            return f"{name} must be a valid date in YYYY-MM-DD format"
+    for name, allowed in _ALLOWED_VALUES.items():
+        value = arguments.get(name)
+        if value is not None and value not in allowed:
+            return f"{name} must be one of: {', '.join(str(v) for v in sorted(allowed - {''}))}"
+    return None
+
+
+# Upper bound for search_transactions_batch, to keep one tool call from flooding the API
+_MAX_BATCH_QUERIES = 10
+
+# search_transactions' arguments and their JSON types, for the filter sets of the batch
+# tool (plain dicts again; an unhashable value would otherwise break the search cache key)
+_SEARCH_FIELD_TYPES = {
+    "description": str,
+    "from_date": str,
+    "to_date": str,
+    "min_amount": (int, float),
+    "max_amount": (int, float),
+    "category": str,
+    "no_invoice": bool,
+    "no_receipt": bool,
+    "status": str,
+    "cashflow_type": str,
+    "limit": int,
+}
+
+
+def _search_query_error(index: int, query: Dict[str, Any]) -> Optional[str]:
+    """Describe what is wrong with one search_transactions_batch filter set, or None if it is valid."""
+    mistyped = [
+        name for name, value in query.items()
+        if value is not None
+        and (
+            not isinstance(value, _SEARCH_FIELD_TYPES[name])
+            or (isinstance(value, bool) and _SEARCH_FIELD_TYPES[name] is not bool)
+        )
+    ]
+    if mistyped:
+        return f"Query {index}: wrong type for {', '.join(mistyped)}"
+    error = _validation_error(query)
+    return f"Query {index}: {error}" if error else None
+
+
+def _search_params(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Build search_transactions query parameters from its (possibly partial) arguments."""
+    return {
+        api_name: arguments[name]
+        for name, api_name in _SEARCH_PARAM_MAP.items()
+        if arguments.get(name)
+    }
+
+
+# Upper bound for create_transactions_bulk; larger imports are split over several calls.
+# At most _BULK_CONCURRENCY of its POSTs are in flight at once.
+_MAX_BULK_TRANSACTIONS = 50
+_BULK_CONCURRENCY = 8
+_REQUIRED_TRANSACTION_FIELDS = ("amount", "description", "cashflow_type", "supplier_country")
+
+
+# (ISO date, epoch time of the next local midnight): bulk imports without dates format
+# today's date once instead of once per row.
+_today_cache = ("", 0.0)
+
+
+def _today_iso() -> str:
+    """Return today's local date as YYYY-MM-DD, recomputed only after midnight."""
+    global _today_cache
+    if time.time() >= _today_cache[1]:
+        today = date.today()
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+        _today_cache = (today.isoformat(), midnight)
+    return _today_cache[0]
+
+
+def _signed_amount(amount: float, cashflow_type: Optional[str]) -> float:
+    """Return *amount* positive for income and negative for anything else."""
+    return (1 if cashflow_type == "INCOME" else -1) * abs(amount)
+
+
+def _transaction_payload(
+    company_id: str,
+    amount: float,
+    description: str,
+    cashflow_type: str,
+    supplier_country: str,
+    category_id: Optional[str] = None,
+    company_category_id: Optional[str] = None,
+    vat_rate: Optional[int] = None,
+    sale_type: Optional[str] = None,
+    date: Optional[str] = None,
+    payment_date: Optional[str] = None,
+    payment_type: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the POST body for a manual transaction from create_transaction's arguments."""
+    transaction_data = {
+        "amount": _signed_amount(amount, cashflow_type),
+        "description": description,
+        "cashflowType": cashflow_type,
+        "valueDate": date or _today_iso(),
+        "vatRate": vat_rate,
+        "saleType": sale_type if sale_type else "",
+        "supplierCountry": supplier_country,
+        "company": company_id
+    }
+    
+    if category_id:
+        transaction_data["category_id"] = category_id
+    if company_category_id:
+        transaction_data["companyCategory"] = company_category_id
+    if payment_date:
+        transaction_data["paymentDate"] = payment_date
+    if payment_type:
+        transaction_data["paymentType"] = payment_type
+    return transaction_data
+
+
+# create_transaction's arguments and their JSON types, for entries of the bulk tool (which
+# arrive as plain dicts, without the pydantic checks of a tool signature)
+_TRANSACTION_FIELD_TYPES = {
+    "amount": (int, float),
+    "description": str,
+    "cashflow_type": str,
+    "supplier_country": str,
+    "category_id": str,
+    "company_category_id": str,
+    "vat_rate": int,
+    "sale_type": str,
+    "date": str,
+    "payment_date": str,
+    "payment_type": str,
+}
+_TRANSACTION_FIELDS = frozenset(_TRANSACTION_FIELD_TYPES)
+
+
+def _bulk_item_error(index: int, item: Dict[str, Any]) -> Optional[str]:
+    """Describe what is wrong with one create_transactions_bulk entry, or None if it is valid."""
+    missing = [name for name in _REQUIRED_TRANSACTION_FIELDS if item.get(name) is None]
+    if missing:
+        return f"Transaction {index}: missing {', '.join(missing)}"
+    unknown = sorted(item.keys() - _TRANSACTION_FIELDS)
+    if unknown:
+        return f"Transaction {index}: unknown fields {', '.join(unknown)}"
+    mistyped = [
+        name for name, value in item.items()
+        if value is not None
+        and (isinstance(value, bool) or not isinstance(value, _TRANSACTION_FIELD_TYPES[name]))
+    ]
+    if mistyped:
+        return f"Transaction {index}: wrong type for {', '.join(mistyped)}"
+    error = _validation_error(item)
+    return f"Transaction {index}: {error}" if error else None
+
+# Agents repeat identical searches (retries, re-checks after an answer); serve those from
+# memory for a short while and let concurrent identical searches share one request.
+# Keys are (company_id, sorted params); any transaction write clears the company's entries
+# and bumps its generation, so a search that was already running during the write neither
+# repopulates the cache nor is joined by later callers.
+_SEARCH_CACHE = TTLCache(ttl=30)
+_SEARCH_INFLIGHT: Dict[tuple, asyncio.Task] = {}
+_SEARCH_GENERATIONS: Dict[Optional[str], int] = {}
+
+
+async def _search(api, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """GET a transaction search through the cache, coalescing identical in-flight requests."""
+    key = (api.company_id, tuple(sorted(params.items())))
+    cached = _SEARCH_CACHE.get(key)
+    if cached is not None:
+        return cached
+    generation = _SEARCH_GENERATIONS.get(api.company_id, 0)
+    task = _SEARCH_INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(api._amake_request("GET", url, params=dict(params)))
+        _SEARCH_INFLIGHT[key] = task
+        # Only remove our own entry; an invalidation may have replaced it meanwhile
+        task.add_done_callback(
+            lambda done: _SEARCH_INFLIGHT.pop(key) if _SEARCH_INFLIGHT.get(key) is done else None
+        )
+    # Shielded so one caller being cancelled does not cancel the request for the others
+    result = await asyncio.shield(task)
+    if (
+        not (isinstance(result, dict) and "error" in result)
+        and _SEARCH_GENERATIONS.get(api.company_id, 0) == generation
+    ):
+        _SEARCH_CACHE.set(key, result)
+    return result
+
+
+def invalidate_transaction_searches(company_id: Optional[str]) -> None:
+    """Forget cached searches for a company after anything that changes its transactions."""
+    _SEARCH_GENERATIONS[company_id] = _SEARCH_GENERATIONS.get(company_id, 0) + 1
+    _SEARCH_CACHE.discard_where(lambda key: key[0] == company_id)
+    for key in [key for key in _SEARCH_INFLIGHT if key[0] == company_id]:
+        del _SEARCH_INFLIGHT[key]
+
 def register_transaction_tools(mcp):
     """Register all transaction-related tools with the MCP server."""
     
@@ -30,14 +352,17 @@ def register_transaction_tools(mcp):
         min_amount: Optional[float] = Field(default=None, description="Minimum transaction amount"),
         max_amount: Optional[float] = Field(default=None, description="Maximum transaction amount"),
         category: Optional[str] = Field(default=None, description="Transaction category"),
-        no_invoice: Optional[bool] = Field(default=None, description="Whether to exclude invoices"),
-        no_receipt: Optional[bool] = Field(default=None, description="Whether to exclude receipts"),
+        no_invoice: Optional[bool] = Field(default=None, description="If true, only return transactions without a linked invoice (false or omitted: no filter)"),
+        no_receipt: Optional[bool] = Field(default=None, description="If true, only return transactions without an attached receipt (false or omitted: no filter)"),
         status: Optional[str] = Field(default=None, description="Status of the transaction (UNVERIFIED, VERIFIED)"),
         cashflow_type: Optional[str] = Field(default=None, description="Cashflow type of the transaction (INCOME, EXPENSE)"),
         limit: Optional[int] = Field(default=None, description="Maximum number of results to return (default 100)")
     ) -> Dict[str, Any]:
         """
         Search for transactions matching specified criteria.
+
+        All filters are applied by the API, so narrowing with no_invoice/no_receipt
+        plus a date range returns only the matching page instead of every transaction.
         
         Args:
             description: Text to search for in transaction descriptions
@@ -47,51 +372,78 @@ def register_transaction_tools(mcp):
             max_amount: Maximum transaction amount
             category: Transaction category
             limit: Maximum number of results to return (default 100)
-            no_invoice: Whether to exclude invoices
-            no_receipt: Whether to exclude receipts
+            no_invoice: If true, only transactions without a linked invoice
+            no_receipt: If true, only transactions without an attached receipt
             status: Status of the transaction (UNVERIFIED, VERIFIED)
             cashflow_type: Cashflow type of the transaction (INCOME, EXPENSE)
             
         Returns:
             List of matching transactions with sensitive data removed
         """
+        error = _validation_error(locals())
+        if error:
+            return {"error": error}
+        
         api = ctx.request_context.lifespan_context["api"]
         company_id = api.company_id
         
         if not company_id:
             return {"error": "No company available. Please authenticate first."}
         
-        transactions_url = urljoin(
-            config.api_base_url, 
-            f"api/v1/companies/{company_id}/accounting/transactions/"
-        )
+        transactions_url = _transactions_url(company_id)
+        
+        params = _search_params(locals())
+        
+        return await _search(api, transactions_url, params)
+
+    @mcp.tool(
+        title="Search Transactions (Batch)",
+        annotations=ToolAnnotations(
+            readOnlyHint=True,
+            destructiveHint=False,
+            idempotentHint=True,
+            openWorldHint=False,
+        ),
+    )
+    async def search_transactions_batch(
+        ctx: Context,
+        queries: List[Dict[str, Any]] = Field(
+            description=(
+                f"Up to {_MAX_BATCH_QUERIES} filter sets, each using search_transactions' "
+                f"argument names: {', '.join(_SEARCH_PARAM_MAP)}"
+            ),
+        ),
+    ) -> Dict[str, Any]:
+        """
+        Run several transaction searches at once (e.g. one per category or month).
+
+        Prefer this over calling search_transactions repeatedly; the searches run
+        concurrently.
+
+        Returns:
+            {"results": [...]} with one search result per query, in the same order
+        """
+        api = ctx.request_context.lifespan_context["api"]
+        company_id = api.company_id
         
-        # Build query parameters
-        params = {}
-        if description:
-            params["description"] = description
-        if from_date:
-            params["dateFrom"] = from_date
-        if to_date:
-            params["dateTo"] = to_date
-        if min_amount:
-            params["minAmount"] = min_amount
-        if max_amount:
-            params["maxAmount"] = max_amount
-        if category:
-            params["category_name"] = category
-        if no_invoice:
-            params["noInvoice"] = no_invoice
-        if no_receipt:
-            params["noAttachment"] = no_receipt
-        if status:
-            params["status"] = status
-        if cashflow_type:
-            params["cashflowType"] = cashflow_type
-        if limit:
-            params["limit"] = limit
+        if not company_id:
+            return {"error": "No company available. Please authenticate first."}
+        if len(queries) > _MAX_BATCH_QUERIES:
+            return {"error": f"At most {_MAX_BATCH_QUERIES} queries per batch."}
+        unknown = sorted({name for query in queries for name in query} - _SEARCH_PARAM_MAP.keys())
+        if unknown:
+            return {"error": f"Unknown search filters: {', '.join(unknown)}"}
+        for i, query in enumerate(queries):
+            error = _search_query_error(i, query)
+            if error:
+                return {"error": error}
         
-        return api._make_request("GET", transactions_url, params=params)
+        transactions_url = _transactions_url(company_id)
+        
+        results = await asyncio.gather(
+            *(_search(api, transactions_url, _search_params(query)) for query in queries)
+        )
+        return {"results": list(results)}
 
     @mcp.tool(
         title="Create Transaction",
@@ -106,15 +458,15 @@ def register_transaction_tools(mcp):
         ctx: Context,
         amount: float = Field(description="Transaction amount (positive for income, negative for expense)"),
         description: str = Field(description="Transaction description"),
-        cashflow_type: str = Field(description="Cashflow type of the transaction (INCOME, EXPENSE)"),
-        supplier_country: str = Field(description="Country of the supplier (DE, INSIDE_EU, OUTSIDE_EU)"),
+        cashflow_type: CashflowType = Field(description="Cashflow type of the transaction (INCOME, EXPENSE)"),
+        supplier_country: SupplierCountry = Field(description="Country of the supplier (DE, INSIDE_EU, OUTSIDE_EU)"),
         category_id: Optional[str] = Field(default=None, description="Freelance category ID (for non-SME companies). If not provided, auto-categorized via AI."),
         company_category_id: Optional[str] = Field(default=None, description="SME company category ID from the DATEV chart of accounts (for GmbH/UG companies). Use list_company_categories to find the right ID."),
-        vat_rate: Optional[int] = Field(default=None, description="VAT rate (0, 7, 19)"),
-        sale_type: Optional[str] = Field(default=None, description="Sale type (GOODS, SERVICES)"),
+        vat_rate: Optional[VatRate] = Field(default=None, description="VAT rate (0, 7, 19)"),
+        sale_type: Optional[SaleType] = Field(default=None, description="Sale type (GOODS, SERVICES)"),
         date: Optional[str] = Field(default=None, description="Transaction date (document/invoice date) in YYYY-MM-DD format (defaults to today)"),
         payment_date: Optional[str] = Field(default=None, description="Date when payment was made/received in YYYY-MM-DD format. Used for SME accrual accounting."),
-        payment_type: Optional[str] = Field(default=None, description="Payment method: BANK, CASH, NOT_PAID"),
+        payment_type: Optional[PaymentType] = Field(default=None, description="Payment method: BANK, CASH, NOT_PAID"),
     ) -> Dict[str, Any]:
         """
         Create a new manual transaction.
@@ -122,41 +474,96 @@ def register_transaction_tools(mcp):
         For SME companies (GmbH/UG), use company_category_id instead of category_id,
         and optionally set payment_date and payment_type for accrual accounting.
         """
+        error = _validation_error(locals())
+        if error:
+            return {"error": error}
+        
         api = ctx.request_context.lifespan_context["api"]
         company_id = api.company_id
         
-        if cashflow_type not in ["INCOME", "EXPENSE"]:
-            return {"error": "cashflow_type must be either 'INCOME' or 'EXPENSE'"}
+        transactions_url = _transactions_url(company_id)
         
-        if not date:
-            date = datetime.now().strftime("%Y-%m-%d")
-        
-        transactions_url = urljoin(
-            config.api_base_url, 
-            f"api/v1/companies/{company_id}/accounting/transactions/"
+        transaction_data = _transaction_payload(
+            company_id,
+            amount=amount,
+            description=description,
+            cashflow_type=cashflow_type,
+            supplier_country=supplier_country,
+            category_id=category_id,
+            company_category_id=company_category_id,
+            vat_rate=vat_rate,
+            sale_type=sale_type,
+            date=date,
+            payment_date=payment_date,
+            payment_type=payment_type,
         )
         
-        transaction_data = {
-            "amount": abs(amount) if cashflow_type == "INCOME" else -abs(amount),
-            "description": description,
-            "cashflowType": cashflow_type,
-            "valueDate": date,
-            "vatRate": vat_rate,
-            "saleType": sale_type if sale_type else "",
-            "supplierCountry": supplier_country,
-            "company": company_id
-        }
+        result = await api._amake_request("POST", transactions_url, json_data=transaction_data)
+        invalidate_transaction_searches(company_id)
+        return result
+
+    @mcp.tool(
+        title="Create Transactions (Bulk)",
+        annotations=ToolAnnotations(
+            readOnlyHint=False,
+            destructiveHint=False,
+            idempotentHint=False,
+            openWorldHint=False,
+        ),
+    )
+    async def create_transactions_bulk(
+        ctx: Context,
+        transactions: List[Dict[str, Any]] = Field(
+            description=(
+                f"Up to {_MAX_BULK_TRANSACTIONS} transactions, each using create_transaction's "
+                f"argument names: {', '.join(sorted(_TRANSACTION_FIELDS))}"
+            ),
+        ),
+    ) -> Dict[str, Any]:
+        """
+        Create several manual transactions at once (e.g. rows of an imported bank statement).
+
+        All entries are validated before anything is created; the transactions are then
+        created concurrently.
+
+        Returns:
+            {"results": [...]} with one created transaction (or error) per entry, in the same order
+        """
+        api = ctx.request_context.lifespan_context["api"]
+        company_id = api.company_id
         
-        if category_id:
-            transaction_data["category_id"] = category_id
-        if company_category_id:
-            transaction_data["companyCategory"] = company_category_id
-        if payment_date:
-            transaction_data["paymentDate"] = payment_date
-        if payment_type:
-            transaction_data["paymentType"] = payment_type
+        if not company_id:
+            return {"error": "No company available. Please authenticate first."}
+        if len(transactions) > _MAX_BULK_TRANSACTIONS:
+            return {"error": f"At most {_MAX_BULK_TRANSACTIONS} transactions per call."}
+        errors = [
+            error for error in (_bulk_item_error(i, item) for i, item in enumerate(transactions))
+            if error
+        ]
+        if errors:
+            return {"error": "; ".join(errors)}
         
-        return api._make_request("POST", transactions_url, json_data=transaction_data)
+        transactions_url = _transactions_url(company_id)
+        payloads = [_transaction_payload(company_id, **item) for item in transactions]
+        semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+        
+        async def create(payload):
+            async with semaphore:
+                return await api._amake_request("POST", transactions_url, json_data=payload)
+        
+        try:
+            results = await asyncio.gather(
+                *(create(payload) for payload in payloads), return_exceptions=True
+            )
+        finally:
+            invalidate_transaction_searches(company_id)
+        # One failed entry must not hide the outcome of the others
+        return {
+            "results": [
+                {"error": f"Request failed: {result}"} if isinstance(result, Exception) else result
+                for result in results
+            ]
+        }
 
     @mcp.tool(
         title="Update Transaction",
@@ -175,7 +582,7 @@ def register_transaction_tools(mcp):
         category: Optional[str] = Field(default=None, description="Freelance category name or ID"),
         date: Optional[str] = Field(default=None, description="Transaction date (document/invoice date) in YYYY-MM-DD format"),
         vat_rate: Optional[int] = Field(default=None, description="VAT rate (0, 7, 19)"),
-        sale_type: Optional[str] = Field(default=None, description="Sale type (GOODS, SERVICES)"),
+        sale_type: Optional[str] = Field(default=None, description="Sale type (GOODS, SERVICES); an empty string clears it"),
         supplier_country: Optional[str] = Field(default=None, description="Country of the supplier (DE, INSIDE_EU, OUTSIDE_EU)"),
         cashflow_type: Optional[str] = Field(default=None, description="Cashflow type of the transaction (INCOME, EXPENSE)"),
         category_id: Optional[str] = Field(default=None, description="Freelance category ID"),
@@ -184,44 +591,31 @@ def register_transaction_tools(mcp):
         payment_type: Optional[str] = Field(default=None, description="Payment method: BANK, CASH, NOT_PAID"),
     ) -> Dict[str, Any]:
         """Update an existing transaction. For SME companies, use company_category_id and payment fields."""
+        error = _validation_error(locals())
+        if error:
+            return {"error": error}
+        
         api = ctx.request_context.lifespan_context["api"]
         company_id = api.company_id
         
         if not company_id:
             return {"error": "No company available. Please authenticate first."}
         
-        transaction_url = urljoin(
-            config.api_base_url, 
-            f"api/v1/companies/{company_id}/accounting/transactions/{transaction_id}/"
-        )
+        transaction_url = _transactions_url(company_id, f"{transaction_id}/")
         
-        update_data = {}
+        arguments = locals()
+        update_data = {
+            api_name: arguments[name]
+            for name, api_name in _UPDATE_PARAM_MAP.items()
+            if arguments[name] is not None
+        }
+        # The sign of the amount follows the cashflow type, so it is not a plain rename
         if amount is not None:
-            update_data["amount"] = abs(amount) if cashflow_type == "INCOME" else -abs(amount)
-        if description is not None:
-            update_data["description"] = description
-        if category is not None:
-            update_data["category"] = category
-        if date is not None:
-            update_data["valueDate"] = date
-        if vat_rate is not None:
-            update_data["vatRate"] = vat_rate
-        if sale_type is not None:
-            update_data["saleType"] = sale_type if sale_type else ""
-        if supplier_country is not None:
-            update_data["supplierCountry"] = supplier_country
-        if cashflow_type is not None:
-            update_data["cashflowType"] = cashflow_type
-        if category_id is not None:
-            update_data["category"] = category_id
-        if company_category_id is not None:
-            update_data["companyCategory"] = company_category_id
-        if payment_date is not None:
-            update_data["paymentDate"] = payment_date
-        if payment_type is not None:
-            update_data["paymentType"] = payment_type
+            update_data["amount"] = _signed_amount(amount, cashflow_type)
             
-        return api._make_request("PATCH", transaction_url, json_data=update_data)
+        result = await api._amake_request("PATCH", transaction_url, json_data=update_data)
+        invalidate_transaction_searches(company_id)
+        return result
 
     @mcp.tool(
         title="Categorize Transaction",
@@ -251,18 +645,26 @@ def register_transaction_tools(mcp):
         """
         api = ctx.request_context.lifespan_context["api"]
         
-        detect_url = urljoin(
-            config.api_base_url,
-            "api/v1/assistant/detect-category/"
-        )
-        
         request_data = {
             "transaction_amount": transaction_amount,
             "transaction_description": transaction_description,
             "transaction_type": transaction_type
         }
         
-        return api._make_request("POST", detect_url, json_data=request_data)
+        key = (
+            api.company_id,
+            _merchant_key(transaction_description),
+            transaction_amount >= 0,
+            _amount_bracket(transaction_amount),
+            transaction_type.lower(),
+        )
+        cached = _CATEGORY_CACHE.get(key)
+        if cached is not None:
+            return cached
+        result = await api._amake_request("POST", _DETECT_CATEGORY_URL, json_data=request_data)
+        if isinstance(result, dict) and result and "error" not in result and key[1]:
+            _CATEGORY_CACHE.set(key, result)
+        return result
 
     @mcp.tool(
         title="Change Transaction Verification Status",
@@ -297,9 +699,8 @@ def register_transaction_tools(mcp):
         # Choose the appropriate endpoint based on the verify parameter
         action = "verify" if verify else "unverify"
         
-        transaction_url = urljoin(
-            config.api_base_url,
-            f"api/v1/companies/{company_id}/accounting/transactions/{transaction_id}/{action}/"
-        )
+        transaction_url = _transactions_url(company_id, f"{transaction_id}/{action}/")
         
-        return api._make_request("POST", transaction_url) 
\ No newline at end of file
+        result = await api._amake_request("POST", transaction_url)
+        invalidate_transaction_searches(company_id)
+        return result 
\ No newline at end of file
@@ -2,20 +2,26 @@
 """Debug utility for testing SSE connections with OAuth tokens."""
 
 import sys
-import requests
 import json
-import time
+import asyncio
 import argparse
-import sseclient
+import importlib.util
 
-def test_token(token, base_url="http://localhost:3001"):
+import httpx
+
+# With the optional h2 package, concurrent SSE streams can share one HTTP/2 connection.
+# httpx negotiates h2 only via TLS ALPN, so a plain http:// base URL stays on HTTP/1.1
+# with one connection per stream; the negotiated version is printed per stream.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+async def test_token(client, token, base_url="http://localhost:3001"):
     """Test if a token is valid using the debug endpoint."""
     headers = {"Authorization": f"Bearer {token}"}
-    
+
     # Test with our debug endpoint
     debug_url = f"{base_url}/norman/token-debug"
     try:
-        response = requests.get(debug_url, headers=headers)
+        response = await client.get(debug_url, headers=headers)
         print(f"Token debug response ({response.status_code}):")
         print(json.dumps(response.json(), indent=2))
         return response.status_code == 200
@@ -23,68 +29,89 @@ def test_token(token, base_url="http://localhost:3001"):
         print(f"Error testing token: {str(e)}")
         return False
 
-def test_sse_connection(token, base_url="http://localhost:3001"):
+async def iter_sse_events(response):
+    """Yield (event, data) pairs from an SSE stream (blank line terminates an event)."""
+    event, data = "message", []
+    async for line in response.aiter_lines():
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+        elif line.startswith("event:"):
+            event = line[6:].strip()
+        elif line.startswith("data:"):
+            data.append(line[5:].lstrip())
+
+async def test_sse_connection(client, token, base_url="http://localhost:3001", label=""):
     """Test connecting to the SSE endpoint with the token."""
     headers = {"Authorization": f"Bearer {token}"}
-    
+
     # Connect to SSE endpoint
     sse_url = f"{base_url}/sse"
-    print(f"Connecting to SSE endpoint at {sse_url}")
-    
+    print(f"{label}Connecting to SSE endpoint at {sse_url}")
+
     try:
-        response = requests.get(sse_url, headers=headers, stream=True)
-        
-        if response.status_code != 200:
-            print(f"Failed to connect to SSE: Status {response.status_code}")
-            print(f"Response: {response.text}")
-            return False
-            
-        print("SSE connection established!")
-        
-        # Use SSE client to parse events
-        client = sseclient.SSEClient(response)
-        
-        # Listen for a few events
-        print("Waiting for events...")
-        event_count = 0
-        try:
-            for event in client.events():
+        async with client.stream("GET", sse_url, headers=headers) as response:
+            if response.status_code != 200:
+                await response.aread()
+                print(f"{label}Failed to connect to SSE: Status {response.status_code}")
+                print(f"{label}Response: {response.text}")
+                return False
+
+            print(f"{label}SSE connection established! ({response.http_version})")
+
+            # Listen for a few events
+            print(f"{label}Waiting for events...")
+            event_count = 0
+            async for event, data in iter_sse_events(response):
                 event_count += 1
-                print(f"Received event {event_count}:")
-                print(f"  Event: {event.event}")
-                print(f"  Data: {event.data[:100]}..." if len(event.data) > 100 else f"  Data: {event.data}")
-                
+                print(f"{label}Received event {event_count}:")
+                print(f"{label}  Event: {event}")
+                print(f"{label}  Data: {data[:100]}..." if len(data) > 100 else f"{label}  Data: {data}")
+
                 if event_count >= 3:
                     break
-                    
-        except KeyboardInterrupt:
-            print("Interrupted!")
-        finally:
-            response.close()
-            
+
         return True
     except Exception as e:
-        print(f"Error in SSE connection: {str(e)}")
+        print(f"{label}Error in SSE connection: {str(e)}")
         return False
 
+async def run(args):
+    # One client (and connection pool) for every check; SSE streams never time out
+    async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=httpx.Timeout(10.0, read=None)) as client:
+        # First check if the token is valid
+        print("Testing token validity...")
+        if not await test_token(client, args.token, args.base_url):
+            print("Token validation failed! Cannot continue.")
+            return 1
+
+        print("\nTesting SSE connection...")
+        if args.concurrency == 1:
+            await test_sse_connection(client, args.token, args.base_url)
+        else:
+            # N concurrent SSE clients on one event loop instead of N threads
+            await asyncio.gather(*(
+                test_sse_connection(client, args.token, args.base_url, label=f"[{i}] ")
+                for i in range(1, args.concurrency + 1)
+            ))
+
+    return 0
+
 def main():
     """Main entry point for the debug utility."""
     parser = argparse.ArgumentParser(description="Debug utility for testing SSE connections with OAuth tokens")
     parser.add_argument("token", help="OAuth token to test")
     parser.add_argument("--base-url", default="http://localhost:3001", help="Base URL of the MCP server")
-    
+    parser.add_argument("--concurrency", type=int, default=1, help="Number of SSE connections to open at once")
+
     args = parser.parse_args()
-    
-    # First check if the token is valid
-    print("Testing token validity...")
-    if not test_token(args.token, args.base_url):
-        print("Token validation failed! Cannot continue.")
-        return 1
-    
-    print("\nTesting SSE connection...")
-    test_sse_connection(args.token, args.base_url)
-    
-    return 0
+
+    try:
+        return asyncio.run(run(args))
+    except KeyboardInterrupt:
+        print("Interrupted!")
+        return 130
 
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main())
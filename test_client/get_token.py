@@ -2,6 +2,7 @@
 """Get an OAuth token from the Norman MCP server for testing."""
 
 import sys
+import asyncio
 import requests
 import json
 import base64
@@ -9,10 +10,9 @@ import hashlib
 import secrets
 import urllib.parse
 import webbrowser
-import http.server
-import socketserver
-import threading
-import time
+from http import HTTPStatus
+
+import httpx
 
 # Server configuration
 SERVER_HOST = "localhost"
@@ -29,7 +29,6 @@ MCP_URL = f"http://{MCP_HOST}:{MCP_PORT}"
 # Global variables to store token information
 access_token = None
 refresh_token = None
-token_event = threading.Event()
 
 def generate_code_verifier():
     """Generate a code verifier for PKCE."""
@@ -38,11 +37,8 @@ def generate_code_verifier():
 
 def generate_code_challenge(code_verifier):
     """Generate a code challenge from code verifier using S256 method."""
-    code_verifier_bytes = code_verifier.encode('ascii')
-    hash_object = hashlib.sha256(code_verifier_bytes)
-    code_challenge_bytes = hash_object.digest()
-    code_challenge = base64.urlsafe_b64encode(code_challenge_bytes).decode('ascii').rstrip('=')
-    return code_challenge
+    digest = hashlib.sha256(code_verifier.encode('ascii')).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
 
 def register_client():
     """Register a test client with the server."""
@@ -64,76 +60,91 @@ def register_client():
     
     return client_data
 
-class TokenHandler(http.server.BaseHTTPRequestHandler):
-    """HTTP request handler to receive OAuth callback."""
+def _http_response(status, body, content_type="text/plain"):
+    """Encode a minimal HTTP/1.1 response that closes the connection."""
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode('ascii') + body
+
+async def exchange_code(client_data, code_verifier, code):
+    """Exchange the authorization code for tokens; return (token_response, error_html)."""
+    token_url = f"{MCP_URL}/token"
+    token_data = {
+        "grant_type": "authorization_code",
+        "client_id": client_data["client_id"],
+        "client_secret": client_data["client_secret"],
+        "code": code,
+        "redirect_uri": CALLBACK_URL,
+        "code_verifier": code_verifier
+    }
+    
+    async with httpx.AsyncClient() as client:
+        response = await client.post(token_url, data=token_data)
     
-    def do_GET(self):
-        """Handle GET request - this will be the OAuth callback."""
+    if response.status_code != 200:
+        return None, f"""
+        <html><body>
+        <h1>Error getting token</h1>
+        <p>Status code: {response.status_code}</p>
+        <p>Response: {response.text}</p>
+        </body></html>
+        """
+    return response.json(), None
+
+async def start_callback_server(client_data, code_verifier, token_event):
+    """Start the callback server to receive the OAuth redirect.
+
+    Each connection is handled on the running event loop; token_event is set once a
+    token has been received and the success page has been sent.
+    """
+    async def handle_callback(reader, writer):
         global access_token, refresh_token
         
-        if not self.path.startswith(CALLBACK_PATH):
-            self.send_response(404)
-            self.end_headers()
-            self.wfile.write(b"Not found")
-            return
+        try:
+            request_line = await reader.readline()
+            # Drain the request headers; the callback only needs the request target
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
             
-        print(f"Received callback: {self.path}")
-        
-        # Extract the code parameter
-        query_params = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
-        code = query_params.get('code', [''])[0]
-        
-        if not code:
-            self.send_response(400)
-            self.end_headers()
-            self.wfile.write(b"No code parameter in callback")
-            return
+            parts = request_line.decode('latin-1').split()
+            path = parts[1] if len(parts) >= 2 else ""
+            if not path.startswith(CALLBACK_PATH):
+                writer.write(_http_response(HTTPStatus.NOT_FOUND, b"Not found"))
+                return
             
-        print(f"Received authorization code: {code}")
-        
-        # Exchange code for token
-        client_id = self.server.client_data["client_id"]
-        client_secret = self.server.client_data["client_secret"]
-        code_verifier = self.server.code_verifier
-        
-        token_url = f"{MCP_URL}/token"
-        token_data = {
-            "grant_type": "authorization_code",
-            "client_id": client_id,
-            "client_secret": client_secret, 
-            "code": code,
-            "redirect_uri": CALLBACK_URL,
-            "code_verifier": code_verifier
-        }
-        
-        try:
-            response = requests.post(token_url, data=token_data)
+            print(f"Received callback: {path}")
+            
+            # Extract the code parameter
+            query_params = urllib.parse.parse_qs(urllib.parse.urlparse(path).query)
+            code = query_params.get('code', [''])[0]
+            
+            if not code:
+                writer.write(_http_response(HTTPStatus.BAD_REQUEST, b"No code parameter in callback"))
+                return
             
-            if response.status_code != 200:
-                error_html = f"""
-                <html><body>
-                <h1>Error getting token</h1>
-                <p>Status code: {response.status_code}</p>
-                <p>Response: {response.text}</p>
-                </body></html>
-                """.encode('utf-8')
-                self.send_response(200)
-                self.send_header('Content-Type', 'text/html')
-                self.send_header('Content-Length', len(error_html))
-                self.end_headers()
-                self.wfile.write(error_html)
+            print(f"Received authorization code: {code}")
+            
+            try:
+                token_response, error_html = await exchange_code(client_data, code_verifier, code)
+            except Exception as e:
+                print(f"Error exchanging code for token: {str(e)}")
+                writer.write(_http_response(HTTPStatus.INTERNAL_SERVER_ERROR, f"Error: {str(e)}".encode('utf-8')))
+                return
+            
+            if error_html:
+                writer.write(_http_response(HTTPStatus.OK, error_html.encode('utf-8'), "text/html"))
                 return
-                
-            token_response = response.json()
+            
             access_token = token_response.get("access_token")
             refresh_token = token_response.get("refresh_token")
             
             print(f"Received access token: {access_token}")
             if refresh_token:
                 print(f"Received refresh token: {refresh_token}")
-                
-            # Notify the main thread that we have the token
-            token_event.set()
             
             # Return success page
             success_html = f"""
@@ -144,36 +155,34 @@ class TokenHandler(http.server.BaseHTTPRequestHandler):
             <pre>{json.dumps(token_response, indent=2)}</pre>
             </body></html>
             """.encode('utf-8')
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html')
-            self.send_header('Content-Length', len(success_html))
-            self.end_headers()
-            self.wfile.write(success_html)
+            writer.write(_http_response(HTTPStatus.OK, success_html, "text/html"))
+            await writer.drain()
             
-        except Exception as e:
-            print(f"Error exchanging code for token: {str(e)}")
-            self.send_response(500)
-            self.end_headers()
-            self.wfile.write(f"Error: {str(e)}".encode('utf-8'))
+            # Wake up the waiting flow only after the page is sent, since it closes the
+            # server as soon as it resumes
+            token_event.set()
+        finally:
+            writer.close()
     
-    def log_message(self, format, *args):
-        """Override to disable logging."""
-        return
+    server = await asyncio.start_server(handle_callback, SERVER_HOST, SERVER_PORT)
+    print(f"Callback server started at {CALLBACK_URL}")
+    return server
 
-def start_callback_server(client_data, code_verifier):
-    """Start the callback server to receive the OAuth redirect."""
-    handler = TokenHandler
+async def wait_for_token(client_data, code_verifier, authorize_url, timeout=300):
+    """Serve the OAuth callback until a token arrives or *timeout* seconds pass."""
+    token_event = asyncio.Event()
+    server = await start_callback_server(client_data, code_verifier, token_event)
     
-    with socketserver.TCPServer((SERVER_HOST, SERVER_PORT), handler) as httpd:
-        print(f"Callback server started at {CALLBACK_URL}")
+    async with server:
+        print(f"Opening browser to authorize URL: {authorize_url}")
+        webbrowser.open(authorize_url)
         
-        # Add client data and code verifier to the server instance
-        httpd.client_data = client_data
-        httpd.code_verifier = code_verifier
-        
-        # Run the server until we get the token
-        while not token_event.is_set():
-            httpd.handle_request()
+        # Wait for the token to be received
+        print("Waiting for authorization...")
+        try:
+            await asyncio.wait_for(token_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
 
 def main():
     """Main entry point."""
@@ -187,14 +196,6 @@ def main():
     print(f"Code verifier: {code_verifier}")
     print(f"Code challenge: {code_challenge}")
     
-    # Start the callback server in a separate thread
-    server_thread = threading.Thread(
-        target=start_callback_server,
-        args=(client_data, code_verifier)
-    )
-    server_thread.daemon = True
-    server_thread.start()
-    
     # Build the authorization URL
     client_id = client_data["client_id"]
     authorize_params = {
@@ -206,12 +207,8 @@ def main():
     }
     authorize_url = f"{MCP_URL}/authorize?{urllib.parse.urlencode(authorize_params)}"
     
-    print(f"Opening browser to authorize URL: {authorize_url}")
-    webbrowser.open(authorize_url)
-    
-    # Wait for the token to be received
-    print("Waiting for authorization...")
-    token_event.wait(timeout=300)  # 5 minutes timeout
+    # Serve the callback on an event loop until the token arrives (5 minutes timeout)
+    asyncio.run(wait_for_token(client_data, code_verifier, authorize_url))
     
     if not access_token:
         print("Failed to get access token within the timeout period.")
@@ -13,10 +13,15 @@ Usage:
 """
 
 import asyncio
+import atexit
+import importlib.util
 import logging
+import queue
+import socket
 import sys
 import os
-from datetime import timedelta
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from logging.handlers import QueueHandler, QueueListener
 from urllib.parse import parse_qs, urlparse
 
 import httpx
@@ -27,15 +32,92 @@ from mcp.client.streamable_http import streamable_http_client
 from mcp.client.auth import OAuthClientProvider, TokenStorage
 from mcp.shared.auth import OAuthClientInformationFull, OAuthClientMetadata, OAuthToken
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
+
+def setup_logging():
+    """Log through a queue so records are written to stdout by a background thread.
+
+    The event loop only enqueues records; formatting and the blocking write happen
+    in the listener thread, which is flushed and stopped at exit.
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    # Enqueue the bare message; the stream handler applies the real format
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, stream_handler)
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    listener.start()
+    atexit.register(listener.stop)
+
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package; without it httpx stays on HTTP/1.1.
+# Servers that don't negotiate h2 via ALPN are also served over HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Separate budgets: connecting fails fast and ordinary requests get 30s. Only the
+# transport's standalone event stream (its GET) gets the long SSE read budget, so it is
+# not cut off between events while a hung POST still fails after REQUEST_TIMEOUT.
+CONNECT_TIMEOUT = 10.0
+REQUEST_TIMEOUT = 30.0
+SSE_READ_TIMEOUT = 300.0
+HTTP_TIMEOUT = httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT)
+SSE_TIMEOUT = httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT, read=SSE_READ_TIMEOUT)
+
+
+async def use_sse_read_timeout(request: httpx.Request) -> None:
+    """Request hook giving the SSE stream GET the long read timeout.
+
+    streamable_http_client sends every request through one client with one timeout, so
+    the per-request override goes into the request's timeout extension.
+    """
+    if request.method == "GET":
+        request.extensions["timeout"] = SSE_TIMEOUT.as_dict()
+
+
+# Default cap on MCP requests in flight at once from this client
+MAX_CONCURRENT_CALLS = 8
+
+
+class Admission:
+    """Admission control for in-flight MCP requests.
+
+    A counter guarded by an asyncio.Condition rather than a Semaphore, so the limit
+    can be changed at runtime with resize() while requests are waiting.
+    """
+
+    def __init__(self, limit: int = MAX_CONCURRENT_CALLS):
+        self.limit = limit
+        self.in_flight = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify(1)
+
+    async def resize(self, limit: int) -> None:
+        """Change the limit; a larger one admits waiting requests right away."""
+        async with self._cond:
+            self.limit = limit
+            self._cond.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+
 
 class InMemoryTokenStorage(TokenStorage):
     """In-memory token storage implementation for OAuth tokens."""
@@ -51,7 +133,7 @@ class InMemoryTokenStorage(TokenStorage):
     async def set_tokens(self, tokens: OAuthToken) -> None:
         """Store tokens."""
         self.tokens = tokens
-        logger.info(f"Stored OAuth tokens: access_token={tokens.access_token[:20]}...")
+        logger.info("Stored OAuth tokens: access_token=%s...", tokens.access_token[:20])
 
     async def get_client_info(self) -> OAuthClientInformationFull | None:
         """Get stored client information."""
@@ -60,7 +142,7 @@ class InMemoryTokenStorage(TokenStorage):
     async def set_client_info(self, client_info: OAuthClientInformationFull) -> None:
         """Store client information."""
         self.client_info = client_info
-        logger.info(f"Stored client info: client_id={client_info.client_id}")
+        logger.info("Stored client info: client_id=%s", client_info.client_id)
 
 
 async def handle_redirect(auth_url: str) -> None:
@@ -86,10 +168,100 @@ async def handle_callback() -> tuple[str, str | None]:
     if not code:
         raise ValueError("No authorization code found in callback URL")
     
-    logger.info(f"Extracted authorization code: {code[:10]}...")
+    logger.info("Extracted authorization code: %s...", code[:10])
     return code, state
 
 
+def create_http_client(auth: httpx.Auth | None = None) -> httpx.AsyncClient:
+    """Create the pooled httpx client used for the streamable HTTP transport.
+
+    Keep-alive connections are reused across requests (and across sessions when the
+    same client is passed to norman_session), so only the first request pays for the
+    TCP/TLS handshake.
+    """
+    return httpx.AsyncClient(
+        auth=auth,
+        http2=HTTP2_AVAILABLE,
+        follow_redirects=True,
+        timeout=HTTP_TIMEOUT,
+        event_hooks={"request": [use_sse_read_timeout]},
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=20, keepalive_expiry=75),
+    )
+
+
+async def prewarm_dns(server_url: str) -> None:
+    """Resolve the server's host ahead of the first request.
+
+    Lets the lookup overlap with client and transport setup; a warm system resolver
+    cache (nscd, systemd-resolved) then answers the real connection immediately.
+    """
+    parsed = urlparse(server_url)
+    if not parsed.hostname:
+        return
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        await asyncio.get_running_loop().getaddrinfo(parsed.hostname, port, type=socket.SOCK_STREAM)
+    except OSError:
+        # The real request reports resolution failures
+        pass
+
+
+async def _discard_task(task: asyncio.Task) -> None:
+    """Cancel *task* if still running and retrieve its outcome, so none is left orphaned."""
+    task.cancel()
+    with suppress(asyncio.CancelledError, Exception):
+        await task
+
+
+@asynccontextmanager
+async def norman_session(
+    server_url: str,
+    auth: httpx.Auth | None = None,
+    http_client: httpx.AsyncClient | None = None,
+):
+    """Yield an initialized ClientSession for the Norman MCP server at *server_url*.
+
+    Connect and initialize happen once; callers can issue any number of requests on
+    the yielded session, e.g.::
+
+        async with norman_session(url) as session:
+            for name, args in calls:
+                await session.call_tool(name, args)
+
+    Pass an *http_client* from create_http_client() to share its connection pool
+    between sessions; it is left open. Otherwise a client is created (with *auth*)
+    and closed with the session.
+    """
+    # Ensure the URL has the /mcp path for streamable HTTP
+    mcp_endpoint = f"{server_url.rstrip('/')}/mcp"
+
+    async with AsyncExitStack() as stack:
+        # Cleaned up however the setup below ends, even if it fails before the await
+        dns_prewarm = asyncio.ensure_future(prewarm_dns(server_url))
+        stack.push_async_callback(_discard_task, dns_prewarm)
+        if http_client is None:
+            http_client = await stack.enter_async_context(create_http_client(auth))
+        async with streamable_http_client(
+            mcp_endpoint,
+            http_client=http_client,
+        ) as (read_stream, write_stream, get_session_id):
+            logger.info("Connected to server, initializing session...")
+
+            # Create a client session
+            async with ClientSession(read_stream, write_stream) as session:
+                # Initialize the connection (the first request, so the lookup must be done)
+                await dns_prewarm
+                await session.initialize()
+                logger.info("Session initialized successfully!")
+
+                # Get the session ID
+                session_id = get_session_id()
+                if session_id:
+                    logger.info("Session ID: %s", session_id)
+
+                yield session
+
+
 async def main():
     """Connect to the Norman MCP server and test basic functionality."""
     # Default server URL - can be overridden with a command line argument
@@ -100,8 +272,8 @@ async def main():
     # Ensure the URL has the /mcp path for streamable HTTP
     mcp_endpoint = f"{server_url.rstrip('/')}/mcp"
 
-    logger.info(f"Connecting to Norman MCP server at {mcp_endpoint}")
-    logger.info(f"Using Streamable HTTP transport with OAuth authentication")
+    logger.info("Connecting to Norman MCP server at %s", mcp_endpoint)
+    logger.info("Using Streamable HTTP transport with OAuth authentication")
 
     # Set up OAuth authentication
     oauth_provider = OAuthClientProvider(
@@ -120,68 +292,60 @@ async def main():
 
     # Connect to the Streamable HTTP server with OAuth
     try:
-        # Create an HTTP client with OAuth authentication
-        async with httpx.AsyncClient(
-            auth=oauth_provider,
-            follow_redirects=True,
-            timeout=httpx.Timeout(30.0, connect=10.0),
-        ) as http_client:
-            async with streamable_http_client(
-                mcp_endpoint,
-                http_client=http_client,
-            ) as (read_stream, write_stream, get_session_id):
-                logger.info("Connected to server, initializing session...")
-
-                # Create a client session
-                async with ClientSession(read_stream, write_stream) as session:
-                    # Initialize the connection
-                    await session.initialize()
-                    logger.info("Session initialized successfully!")
-                    
-                    # Get the session ID
-                    session_id = get_session_id()
-                    if session_id:
-                        logger.info(f"Session ID: {session_id}")
-
-                    # List available prompts
-                    try:
-                        logger.info("\n--- Listing available prompts ---")
-                        prompts_result = await session.list_prompts()
-                        prompts = prompts_result.prompts if hasattr(prompts_result, 'prompts') else prompts_result
-                        logger.info(f"Available prompts: {[p.name for p in prompts]}")
-                    except Exception as e:
-                        logger.error(f"Error listing prompts: {e}")
-
-                    # List available tools
-                    try:
-                        logger.info("\n--- Listing available tools ---")
-                        tools_result = await session.list_tools()
-                        tools = tools_result.tools if hasattr(tools_result, 'tools') else tools_result
-                        logger.info(f"Available tools ({len(tools)} total):")
-                        for tool in tools:
-                            logger.info(f"  - {tool.name}: {tool.description[:50] if tool.description else 'No description'}...")
-                    except Exception as e:
-                        logger.error(f"Error listing tools: {e}")
-
-                    # List available resources
-                    try:
-                        logger.info("\n--- Listing available resources ---")
-                        resources_result = await session.list_resources()
-                        resources = resources_result.resources if hasattr(resources_result, 'resources') else resources_result
-                        logger.info(f"Available resources: {[r.uri for r in resources]}")
-                    except Exception as e:
-                        logger.error(f"Error listing resources: {e}")
-
-                    # Try calling a simple tool
-                    try:
-                        logger.info("\n--- Calling list_clients tool ---")
-                        result = await session.call_tool("list_clients", {})
-                        logger.info(f"Tool result: {result}")
-                    except Exception as e:
-                        logger.error(f"Error calling tool: {e}")
+        async with norman_session(server_url, auth=oauth_provider) as session:
+            # The listings and the tool call are independent requests, so issue
+            # them together (within the admission limit); each failure is logged on its own
+            admission = Admission()
+
+            async def admitted(request):
+                async with admission:
+                    return await request
+
+            prompts_result, tools_result, resources_result, result = await asyncio.gather(
+                admitted(session.list_prompts()),
+                admitted(session.list_tools()),
+                admitted(session.list_resources()),
+                admitted(session.call_tool("list_clients", {})),
+                return_exceptions=True,
+            )
+
+            # List available prompts
+            logger.info("\n--- Listing available prompts ---")
+            if isinstance(prompts_result, Exception):
+                logger.error("Error listing prompts: %s", prompts_result)
+            else:
+                prompts = prompts_result.prompts if hasattr(prompts_result, 'prompts') else prompts_result
+                logger.info("Available prompts: %s", [p.name for p in prompts])
+
+            # List available tools
+            logger.info("\n--- Listing available tools ---")
+            if isinstance(tools_result, Exception):
+                logger.error("Error listing tools: %s", tools_result)
+            else:
+                tools = tools_result.tools if hasattr(tools_result, 'tools') else tools_result
+                logger.info("Available tools (%d total):", len(tools))
+                # Skip the per-tool loop entirely when INFO output is disabled
+                if logger.isEnabledFor(logging.INFO):
+                    for tool in tools:
+                        logger.info("  - %s: %s...", tool.name, tool.description[:50] if tool.description else 'No description')
+
+            # List available resources
+            logger.info("\n--- Listing available resources ---")
+            if isinstance(resources_result, Exception):
+                logger.error("Error listing resources: %s", resources_result)
+            else:
+                resources = resources_result.resources if hasattr(resources_result, 'resources') else resources_result
+                logger.info("Available resources: %s", [r.uri for r in resources])
+
+            # Try calling a simple tool
+            logger.info("\n--- Calling list_clients tool ---")
+            if isinstance(result, Exception):
+                logger.error("Error calling tool: %s", result)
+            else:
+                logger.info("Tool result: %s", result)
 
     except Exception as e:
-        logger.error(f"Connection error: {e}")
+        logger.error("Connection error: %s", e)
         import traceback
         traceback.print_exc()
         raise
@@ -195,39 +359,37 @@ async def main_simple():
 
     mcp_endpoint = f"{server_url.rstrip('/')}/mcp"
 
-    logger.info(f"Connecting to Norman MCP server at {mcp_endpoint}")
-    logger.info(f"Using Streamable HTTP transport (no OAuth)")
+    logger.info("Connecting to Norman MCP server at %s", mcp_endpoint)
+    logger.info("Using Streamable HTTP transport (no OAuth)")
 
     try:
-        async with streamable_http_client(
-            mcp_endpoint,
-            timeout=timedelta(seconds=30),
-            sse_read_timeout=timedelta(seconds=300),
-        ) as (read_stream, write_stream, get_session_id):
-            logger.info("Connected to server, initializing session...")
-
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                logger.info("Session initialized")
-                
-                session_id = get_session_id()
-                logger.info(f"Session ID: {session_id}")
-
-                tools_result = await session.list_tools()
-                tools = tools_result.tools if hasattr(tools_result, 'tools') else tools_result
-                logger.info(f"Available tools: {[t.name for t in tools]}")
+        async with norman_session(server_url) as session:
+            tools_result = await session.list_tools()
+            tools = tools_result.tools if hasattr(tools_result, 'tools') else tools_result
+            logger.info("Available tools: %s", [t.name for t in tools])
 
     except Exception as e:
-        logger.error(f"Connection error: {e}")
+        logger.error("Connection error: %s", e)
         import traceback
         traceback.print_exc()
         raise
 
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, so importing this module (e.g. to
+    # reuse norman_session) leaves the caller's logging setup alone
+    setup_logging()
+
+    # uvloop is a faster drop-in event loop where available (not on Windows)
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+
     # Check if --no-auth flag is passed for simple testing
     if "--no-auth" in sys.argv:
         sys.argv.remove("--no-auth")
-        asyncio.run(main_simple())
+        run(main_simple())
     else:
-        asyncio.run(main())
+        run(main())
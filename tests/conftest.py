@@ -20,5 +20,5 @@ def mock_env_vars():
 @pytest.fixture(autouse=True)
 def disable_actual_api_calls():
     """Prevent any actual HTTP requests during tests."""
-    with patch("requests.request"), patch("requests.post"):
+    with patch("requests.request"), patch("requests.post"), patch("requests.Session.request"):
         yield 
\ No newline at end of file
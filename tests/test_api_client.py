@@ -0,0 +1,10 @@
+"""Tests for the pooled session built in norman_mcp.api.client."""
+from norman_mcp.api.client import _build_session
+
+
+def test_gateway_errors_are_retried_only_for_safe_methods():
+    retries = _build_session().get_adapter("https://api.norman.finance/").max_retries
+    assert retries.is_retry("GET", 502)
+    for method in ("POST", "PUT", "PATCH", "DELETE"):
+        assert not retries.is_retry(method, 502)
+    assert retries.respect_retry_after_header is False
@@ -0,0 +1,40 @@
+"""Tests for the in-process TTL cache."""
+
+from norman_mcp.api.cache import TTLCache
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("norman_mcp.api.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl=30)
+    cache.set("c1", {"status": "data_collection"})
+    now[0] += 29
+    assert cache.get("c1") == {"status": "data_collection"}
+    now[0] += 1
+    assert cache.get("c1") is None
+
+
+def test_full_cache_evicts_oldest_entry():
+    cache = TTLCache(ttl=30, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert (cache.get("b"), cache.get("c")) == (2, 3)
+
+
+def test_pop_invalidates():
+    cache = TTLCache(ttl=30)
+    cache.set("c1", 1)
+    assert cache.pop("c1") == 1
+    assert cache.get("c1") is None
+
+
+def test_discard_where_drops_matching_keys():
+    cache = TTLCache(ttl=30)
+    cache.set(("c1", "a"), 1)
+    cache.set(("c1", "b"), 2)
+    cache.set(("c2", "a"), 3)
+    cache.discard_where(lambda key: key[0] == "c1")
+    assert cache.get(("c1", "a")) is None and cache.get(("c1", "b")) is None
+    assert cache.get(("c2", "a")) == 3
@@ -0,0 +1,64 @@
+"""Tests for the corporate Fragebogen payload helpers."""
+from datetime import date
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from norman_mcp.tools.corporate_tax_registration import (
+    _SECTION_FIELDS,
+    _kleinunternehmer_eligibility,
+    _normalize_iban,
+    _payload,
+    _section_errors,
+    register_corporate_tax_registration_tools,
+)
+
+SECTION_TOOLS = {
+    "company": "update_corporate_company",
+    "registration": "update_corporate_registration_details",
+    "people": "set_corporate_people",
+    "financials": "update_corporate_financials",
+    "vat_and_bank": "update_corporate_vat_and_bank",
+}
+
+
+@pytest.mark.parametrize("section,tool_name", SECTION_TOOLS.items())
+def test_section_table_matches_tool_signature(section, tool_name):
+    server = FastMCP("test")
+    register_corporate_tax_registration_tools(server)
+    params = set(server._tool_manager._tools[tool_name].parameters["properties"]) - {"public_id"}
+    assert params == {name for _, name in _SECTION_FIELDS[section]}
+
+
+def test_payload_maps_to_camel_case_and_drops_unset():
+    payload = _payload(
+        "company",
+        {"company_name": "Acme GmbH", "seat_city": None, "phone": "", "website": ""},
+    )
+    # "" is only kept for fields where it clears a stored value
+    assert payload == {"companyName": "Acme GmbH", "website": ""}
+
+
+def test_section_errors_name_unknown_sections_and_fields():
+    assert _section_errors({"company": {"company_name": "Acme"}, "financials": {}}) == []
+    assert _section_errors({"bank": {}, "company": {"iban": "x"}}) == [
+        "unknown section 'bank'",
+        "unknown field 'company.iban'",
+    ]
+
+
+def test_kleinunternehmer_projects_revenue_to_full_year():
+    result = _kleinunternehmer_eligibility(date(2025, 7, 15), 12000)
+    assert (result["limit"], result["working_months"], result["full_year_equivalent"]) == (25000, 6, 24000)
+    assert result["eligible"] is True
+    assert _kleinunternehmer_eligibility(date(2024, 10, 1), 6000)["eligible"] is False
+
+
+def test_iban_is_normalized_and_checksummed():
+    assert _normalize_iban("de89 3704-0044 0532 0130 00") == "DE89370400440532013000"
+    assert _payload("vat_and_bank", {"bank_iban": "DE89 3704 0044 0532 0130 00"}) == {
+        "bankIban": "DE89370400440532013000"
+    }
+    for bad in ("DE88 3704 0044 0532 0130 00", "DE89", "not an iban", 12345, ["DE89"]):
+        with pytest.raises(ValueError):
+            _normalize_iban(bad)
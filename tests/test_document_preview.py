@@ -0,0 +1,34 @@
+"""Tests for norman_mcp.tools.document_preview."""
+import base64
+
+import pytest
+
+from norman_mcp.tools.document_preview import JPEG_MAGIC, fetch_document_preview
+
+_JPEG = JPEG_MAGIC + b"\xe0rest"
+
+
+class _FakeAPI:
+    def __init__(self, response):
+        self.response = response
+
+    def _make_request(self, method, url, **kwargs):
+        return self.response
+
+
+def _doc(doc_type, data=_JPEG):
+    return {"type": doc_type, "previewImage": base64.b64encode(data).decode()}
+
+
+def test_first_document_or_requested_type():
+    api = _FakeAPI({"documents": [_doc("articles"), _doc("list", JPEG_MAGIC + b"list")]})
+    assert fetch_document_preview(api, "url") == _JPEG
+    assert fetch_document_preview(api, "url", "list") == JPEG_MAGIC + b"list"
+    assert fetch_document_preview(api, "url", "missing") is None
+
+
+def test_backend_error_and_non_jpeg_raise_value_error():
+    with pytest.raises(ValueError, match="boom"):
+        fetch_document_preview(_FakeAPI({"error": "boom"}), "url")
+    with pytest.raises(ValueError, match="not a JPEG"):
+        fetch_document_preview(_FakeAPI({"documents": [_doc("articles", b"%PDF")]}), "url")
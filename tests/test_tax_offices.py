@@ -0,0 +1,22 @@
+"""Tests for the static Finanzamt lookup helpers in norman_mcp.resources.tax_offices."""
+from norman_mcp.resources.tax_offices import get_tax_office_by_code, search_tax_offices
+
+
+def test_get_by_code():
+    assert get_tax_office_by_code("1113") == {"value": "1113", "label": "Berlin - Charlottenburg"}
+    assert get_tax_office_by_code("0000") is None
+
+
+def test_search_is_case_insensitive():
+    assert [o["value"] for o in search_tax_offices("CHARLOTTENBURG")] == ["1113"]
+    assert all("münchen" in o["label"].casefold() for o in search_tax_offices("München"))
+
+
+def test_search_treats_term_literally():
+    # Regex metacharacters in the term must not be interpreted
+    assert all("(" in o["label"] for o in search_tax_offices("("))
+
+
+def test_search_limit_and_empty_term():
+    assert len(search_tax_offices("berlin", limit=3)) == 3
+    assert search_tax_offices("   ") == []
@@ -0,0 +1,27 @@
+"""Tests for the tax report helpers in norman_mcp.tools.taxes."""
+from datetime import datetime, timedelta, timezone
+
+from norman_mcp.tools.taxes import (
+    _PRESIGN_MARGIN,
+    _presign_ttl,
+)
+
+
+def _signed_url(signed_at: datetime, expires: int) -> str:
+    return (
+        "https://bucket.s3.amazonaws.com/report.pdf"
+        f"?X-Amz-Date={signed_at:%Y%m%dT%H%M%SZ}&X-Amz-Expires={expires}&X-Amz-Signature=abc"
+    )
+
+
+def test_presign_ttl_uses_remaining_lifetime():
+    signed_at = datetime.now(timezone.utc) - timedelta(seconds=100)
+    ttl = _presign_ttl(_signed_url(signed_at, 600))
+    assert 600 - 100 - _PRESIGN_MARGIN - 5 < ttl <= 600 - 100 - _PRESIGN_MARGIN
+
+
+def test_presign_ttl_expired_and_unsigned_urls():
+    signed_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert _presign_ttl(_signed_url(signed_at, 600)) < 0
+    assert _presign_ttl("https://example.com/report.pdf", default=240) == 240
+
@@ -0,0 +1,143 @@
+"""Tests for the transaction tool helpers in norman_mcp.tools.transactions."""
+import asyncio
+from datetime import date
+
+from norman_mcp.tools.transactions import (
+    _amount_bracket,
+    _bulk_item_error,
+    _merchant_key,
+    _search,
+    _search_params,
+    _search_query_error,
+    _signed_amount,
+    _today_iso,
+    _transaction_payload,
+    _validation_error,
+    invalidate_transaction_searches,
+)
+
+
+def test_search_params_skip_falsy_filters():
+    params = _search_params(
+        {"description": "Miete", "from_date": "2025-01-01", "no_invoice": False, "min_amount": 0}
+    )
+    assert params == {"description": "Miete", "dateFrom": "2025-01-01"}
+
+
+def test_merchant_key_ignores_dates_case_and_spacing():
+    assert _merchant_key("Netflix  03/2025") == _merchant_key("netflix 04/2025")
+    assert _merchant_key("Miete 01.02.2025") == _merchant_key("MIETE 2025-03-01")
+    assert _merchant_key("Netflix 03/2025") != _merchant_key("Spotify 03/2025")
+    assert _merchant_key("REWE Markt 1234") != _merchant_key("REWE Markt 99")
+
+
+def test_merchant_key_is_empty_for_generic_descriptions():
+    assert _merchant_key("Rechnung 123") == ""
+    assert _merchant_key("SEPA Überweisung 01.02.2025") == ""
+    assert _merchant_key("Lastschrift AB") == ""
+    assert _merchant_key("Rechnung Hetzner 123") == "rechnung hetzner 123"
+
+
+def test_amount_bracket_follows_gwg_limits():
+    assert [_amount_bracket(a) for a in (-12.5, 250, 250.01, 800, 999, 1000.5)] == [0, 0, 1, 1, 2, 3]
+
+
+def test_transaction_payload_signs_amount_by_cashflow_type():
+    payload = _transaction_payload(
+        "c1", amount=12.5, description="Hosting", cashflow_type="EXPENSE",
+        supplier_country="DE", date="2025-03-01", payment_type="BANK",
+    )
+    assert payload["amount"] == -12.5
+    assert payload["valueDate"] == "2025-03-01"
+    assert payload["paymentType"] == "BANK"
+    assert "category_id" not in payload
+
+
+def test_bulk_item_error_reports_missing_and_unknown_fields():
+    assert _bulk_item_error(0, {"amount": 1, "description": "x"}) == (
+        "Transaction 0: missing cashflow_type, supplier_country"
+    )
+    item = {"amount": 1, "description": "x", "cashflow_type": "INCOME", "supplier_country": "DE"}
+    assert _bulk_item_error(1, item) is None
+    assert _bulk_item_error(2, {**item, "iban": "DE00"}) == "Transaction 2: unknown fields iban"
+
+
+def test_validation_error_checks_dates_and_enumerations():
+    assert _validation_error({"from_date": "2025-01-01", "vat_rate": 0, "cashflow_type": "INCOME"}) is None
+    assert _validation_error({"to_date": "01.02.2025"}) == "to_date must be a valid date in YYYY-MM-DD format"
+    assert _validation_error({"date": "2025-13-45"}) == "date must be a valid date in YYYY-MM-DD format"
+    assert _validation_error({"payment_date": "20250101"}) == (
+        "payment_date must be a valid date in YYYY-MM-DD format"
+    )
+    assert _validation_error({"date": "2024-02-29"}) is None
+    assert _validation_error({"supplier_country": "FR"}) == (
+        "supplier_country must be one of: DE, INSIDE_EU, OUTSIDE_EU"
+    )
+    assert _validation_error({"vat_rate": 16}) == "vat_rate must be one of: 0, 7, 19"
+
+
+def test_validation_error_checks_sale_payment_and_status():
+    assert _validation_error({"sale_type": "GOODS", "payment_type": "CASH", "status": "VERIFIED"}) is None
+    assert _validation_error({"status": "DONE"}) == "status must be one of: UNVERIFIED, VERIFIED"
+
+
+def test_today_iso_matches_local_date():
+    assert _today_iso() == date.today().isoformat()
+    assert _today_iso() is _today_iso()
+
+
+def test_signed_amount_follows_cashflow_type():
+    assert _signed_amount(-20, "INCOME") == 20
+    assert _signed_amount(20, "EXPENSE") == -20
+    assert _signed_amount(20, None) == -20
+
+
+def test_search_started_before_a_write_is_not_cached():
+    class SlowAPI:
+        company_id = "c-race"
+        calls = 0
+
+        async def _amake_request(self, method, url, params=None):
+            SlowAPI.calls += 1
+            call = SlowAPI.calls
+            await asyncio.sleep(0.01)
+            return {"results": [], "call": call}
+
+    async def scenario():
+        api = SlowAPI()
+        running = asyncio.ensure_future(_search(api, "url", {"status": "VERIFIED"}))
+        await asyncio.sleep(0)
+        invalidate_transaction_searches(api.company_id)
+        # A search after the write does not join the stale in-flight request
+        fresh = await _search(api, "url", {"status": "VERIFIED"})
+        stale = await running
+        return stale, fresh, await _search(api, "url", {"status": "VERIFIED"})
+
+    stale, fresh, cached = asyncio.run(scenario())
+    assert stale["call"] == 1
+    assert fresh["call"] == 2
+    assert cached is fresh
+
+
+def test_bulk_item_error_reports_wrong_types():
+    item = {"amount": "12.50", "description": "x", "cashflow_type": "INCOME", "supplier_country": "DE"}
+    assert _bulk_item_error(3, item) == "Transaction 3: wrong type for amount"
+    assert _bulk_item_error(4, {**item, "amount": 1, "vat_rate": True}) == (
+        "Transaction 4: wrong type for vat_rate"
+    )
+
+
+def test_empty_sale_type_is_accepted_for_clearing():
+    assert _validation_error({"sale_type": ""}) is None
+    assert _validation_error({"sale_type": "RENT"}) == "sale_type must be one of: GOODS, SERVICES"
+
+
+def test_search_query_error_reports_wrong_types():
+    assert _search_query_error(0, {"description": "rent", "no_invoice": True, "limit": 5}) is None
+    assert _search_query_error(1, {"description": ["rent"]}) == "Query 1: wrong type for description"
+    assert _search_query_error(2, {"min_amount": True, "limit": 2.5}) == (
+        "Query 2: wrong type for min_amount, limit"
+    )
+    assert _search_query_error(3, {"from_date": "01.02.2025"}) == (
+        "Query 3: from_date must be a valid date in YYYY-MM-DD format"
+    )